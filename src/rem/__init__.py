@@ -1,6 +1,16 @@
-from importlib.metadata import PackageNotFoundError, version
+from typing import Any
 
-try:
-    __version__ = version("rem")
-except PackageNotFoundError:
-    __version__ = "0.0.0"
+
+def __getattr__(name: str) -> Any:
+    # Resolved lazily: importlib.metadata is slow to import and only needed
+    # when someone actually asks for the version (e.g. `rem --version`).
+    if name == "__version__":
+        from importlib.metadata import PackageNotFoundError, version
+
+        try:
+            value = version("rem")
+        except PackageNotFoundError:
+            value = "0.0.0"
+        globals()["__version__"] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,35 +1,47 @@
 from __future__ import annotations
 
+import re
 from pathlib import Path
 from typing import Any, Optional
 
 import typer
 
-from rem.core.runner import run_local
 from rem.utils.logger import get_logger
+from rem.utils.serialization import dumps
 
 logger = get_logger(__name__)
 
 
+# Digit runs as int()/float() accept them, with single underscores between digits
+_DIGITS = r"\d+(?:_\d+)*"
+# Matches anything float() would accept once surrounding whitespace is stripped;
+# the `int` group is set only for plain integers.
+_NUMBER_RE = re.compile(
+    rf"[-+]?(?:(?P<int>{_DIGITS})"
+    rf"|(?:{_DIGITS}\.(?:{_DIGITS})?|\.{_DIGITS}|{_DIGITS})(?:[eE][-+]?{_DIGITS})?"
+    r"|inf(?:inity)?|nan)",
+    re.IGNORECASE | re.ASCII,
+)
+
+
 def _coerce(val: str) -> Any:
-    if val.isdigit():
-        return int(val)
-    try:
-        return float(val)
-    except ValueError:
-        if val.lower() in ("true", "false"):
-            return val.lower() == "true"
-        return val
+    val = val.strip()
+    m = _NUMBER_RE.fullmatch(val)
+    if m is not None:
+        return int(val) if m.group("int") is not None else float(val)
+    lowered = val.lower()
+    if lowered == "true":
+        return True
+    if lowered == "false":
+        return False
+    return val
 
 
 def _parse_overrides(items: Optional[list[str]]) -> dict[str, Any]:
     if not items:
         return {}
-    out: dict[str, Any] = {}
-    for item in items:
-        key, val = item.split("=", 1)
-        out[key] = _coerce(val)
-    return out
+    pairs = (item.split("=", 1) for item in items)
+    return {key: _coerce(val) for key, val in pairs}
 
 
 def run_local_cmd(
@@ -46,6 +58,10 @@ def run_local_cmd(
     """
     Run an experiment locally without staging, registry updates or scheduling.
     """
-    overrides_dict = _parse_overrides(override)
-    result = run_local(config=cfg, overrides=overrides_dict or None)
-    typer.echo(result)
+    # Deferred so that `rem --help` doesn't pull in the runner stack
+    from rem.core.runner import run_local
+
+    overrides_dict = _parse_overrides(override) if override else None
+    result = run_local(config=cfg, overrides=overrides_dict)
+    # JSON, like the artifacts a staged run stores in its rep manifest
+    typer.echo(dumps(result, indent=True).decode("utf-8"))
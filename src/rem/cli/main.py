@@ -1,24 +1,31 @@
 from __future__ import annotations
 
+import sys
 from typing import Optional
 
 import typer
 
 from rem.utils.logger import set_global_log_level
 
-try:
-    from rem import __version__
-except Exception:
-    __version__ = "0.0.0.dev0"
-
+# Plain Click help formatting: rendering help through rich imports rich, pygments
+# and markdown_it, which dominates `rem --help` wall time.
 app = typer.Typer(
-    help="REM: A framework for managing and running numerical experiments."
+    help="REM: A framework for managing and running numerical experiments.",
+    rich_markup_mode=None,
 )
 
 
+def _get_version() -> str:
+    try:
+        from rem import __version__
+    except Exception:
+        __version__ = "0.0.0.dev0"
+    return str(__version__)
+
+
 def _version_callback(value: bool) -> None:
     if value:
-        typer.echo(__version__)
+        typer.echo(_get_version())
         raise typer.Exit()
 
 
@@ -49,4 +56,8 @@ app.command("local")(run_local_cmd)
 
 
 def run_cli() -> None:
+    # Answer a bare `rem --version` without building the Click command tree
+    if len(sys.argv) == 2 and sys.argv[1] in ("--version", "-V"):
+        typer.echo(_get_version())
+        return
     app()
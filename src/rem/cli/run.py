@@ -5,7 +5,6 @@ from typing import Any, Optional
 
 import typer
 
-from rem.core.runner import MainRunner, run_local
 from rem.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -29,10 +28,42 @@ def run_cmd(
     group: Optional[str] = typer.Option(
         None, "--group", "-g", help="Resume from an existing experiment group."
     ),
+    flat_config: bool = typer.Option(
+        False,
+        "--flat-config",
+        help="Also stage a flattened copy of each rep's config for debugging.",
+    ),
+    workers: int = typer.Option(
+        1,
+        "--workers",
+        "-w",
+        min=1,
+        help="Number of processes running the reps of a new group in parallel.",
+    ),
+    fsync_events: bool = typer.Option(
+        False,
+        "--fsync-events",
+        help="Sync the event registry to disk after each batch of events.",
+    ),
+    cache_config: bool = typer.Option(
+        False,
+        "--cache-config",
+        help="Cache the parsed config in a sidecar file for faster repeat runs.",
+    ),
 ) -> None:
     """
     Run an experiment locally with optional staging and scheduling.
     """
-    runner = MainRunner(test=test, dryrun=dryrun)
+    # Deferred so that `rem --help` doesn't pull in the runner stack
+    from rem.core.runner import MainRunner
+
+    runner = MainRunner(
+        test=test,
+        dryrun=dryrun,
+        write_flat_config=flat_config,
+        max_workers=workers,
+        fsync_events=fsync_events,
+        cache_config=cache_config,
+    )
     group_id = runner.start(config_path=cfg, reps_per_sweep=reps, group_id=group)
     typer.echo(f"Experiment group ID: {group_id}")
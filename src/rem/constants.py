@@ -1,20 +1,37 @@
+from typing import Final
+
 # Logging
-DEFAULT_LOG_LEVEL = "INFO"
+DEFAULT_LOG_LEVEL: Final = "INFO"
 
 # File names
-EVENTS_FILENAME = "events.jsonl"
-MANIFEST_FILENAME = "manifest.json"
-CONFIG_FLAT_FILENAME = "config_flat.yaml"
-SUBCONFIG_FILENAME = "subconfig.yaml"
+EVENTS_FILENAME: Final = "events.jsonl"
+MANIFEST_FILENAME: Final = "manifest.json"
+CONFIG_FLAT_FILENAME: Final = "config_flat.json"
+SUBCONFIG_FILENAME: Final = "subconfig.yaml"
+CONFIG_CACHE_SUFFIX: Final = ".cache.json"  # config.yaml -> config.yaml.cache.json
+MANIFEST_EVENTS_SUFFIX: Final = (
+    ".events.jsonl"  # manifest.json -> manifest.events.jsonl
+)
 
 # Directory naming
-SWEEP_PAD = 4  # S_0001
-REP_PAD = 3  # R_002
+SWEEP_PAD: Final = 4  # S_0001
+REP_PAD: Final = 3  # R_002
 
 # Naming prefixes
-GROUP_PREFIX = "G_"
-SWEEP_PREFIX = "S_"
-REP_PREFIX = "R_"
+GROUP_PREFIX: Final = "G_"
+SWEEP_PREFIX: Final = "S_"
+REP_PREFIX: Final = "R_"
+
+# Precomputed ID format strings, e.g. SWEEP_FMT.format(1) == "S_0001"
+SWEEP_FMT: Final = f"{SWEEP_PREFIX}{{:0{SWEEP_PAD}d}}"
+REP_FMT: Final = f"{REP_PREFIX}{{:0{REP_PAD}d}}"
+
+# Registry
+EVENT_BATCH_SIZE: Final = 64  # events buffered by MainRunner before an append
+EVENT_MAX_DELAY: Final = 1.0  # seconds a buffered event may wait before a flush
+
+# Staging
+STAGING_MAX_WORKERS: Final = 32  # upper bound on threads used to stage reps
 
 # Marker files
-INCOMPLETE_MARKER = ".incomplete"
+INCOMPLETE_MARKER: Final = ".incomplete"
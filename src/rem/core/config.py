@@ -1,18 +1,112 @@
+import hashlib
+import os
+import threading
 from pathlib import Path
-from typing import Any, Union, cast
+from typing import Any, Optional, Union, cast
 
 import yaml
 from ml_collections import ConfigDict
 
+from rem.constants import CONFIG_CACHE_SUFFIX
+from rem.utils.serialization import dumps, loads
 
-def load_config_from_yaml(path: Union[str, Path]) -> ConfigDict:
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # libyaml bindings not available
+    from yaml import SafeDumper  # type: ignore[assignment]
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+# Node types treated as subtrees when flattening/diffing
+_NESTED_TYPES = (ConfigDict, dict)
+
+
+def _get_cache_path(path: Path) -> Path:
+    return path.with_name(path.name + CONFIG_CACHE_SUFFIX)
+
+
+def _read_config_cache(path: Path, digest: str) -> Optional[Any]:
+    """
+    Return the cached parse of `path` if the sidecar matches its content hash.
+    """
+    try:
+        cached = loads(_get_cache_path(path).read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("sha256") != digest:
+        return None
+    return cached.get("config")
+
+
+def _write_config_cache(path: Path, digest: str, raw: Any) -> None:
+    """
+    Write a JSON sidecar for `path`. Skipped silently if the parsed YAML doesn't
+    survive a JSON round-trip (e.g. dates, non-string keys) or the directory is
+    not writable.
+    """
+    cache_path = _get_cache_path(path)
+    # Created with os.open so the sidecar gets the user's umask, like the YAML
+    tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        payload = dumps({"sha256": digest, "config": raw})
+        if loads(payload)["config"] != raw:
+            return
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            os.write(fd, payload)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError):
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
+def _load_yaml(path: Path, cache: bool) -> Any:
+    if not cache:
+        with path.open("r") as f:
+            return yaml.load(f, Loader=SafeLoader)
+
+    # Keyed on content rather than mtime/size: copies made with cp -p, rsync -t
+    # or tar keep mtimes, so a same-size edit would otherwise go unnoticed
+    data = path.read_bytes()
+    digest = hashlib.sha256(data).hexdigest()
+    raw = _read_config_cache(path, digest)
+    if raw is None:
+        raw = yaml.load(data, Loader=SafeLoader)
+        _write_config_cache(path, digest, raw)
+    return raw
+
+
+def load_config_from_yaml(path: Union[str, Path], cache: bool = False) -> ConfigDict:
     """
     Load a config from a YAML file and convert to ConfigDict.
+
+    If `cache` is set, the parsed YAML is stored in a JSON sidecar next to the file
+    (keyed on a hash of its contents) and reused on later loads. Off by default,
+    since it writes into the config's directory.
     """
-    path = Path(path)
-    with path.open("r") as f:
-        raw = yaml.safe_load(f)
-    return ConfigDict(raw)
+    return ConfigDict(_load_yaml(Path(path), cache))
+
+
+def load_dict_from_yaml(path: Union[str, Path], cache: bool = False) -> dict[str, Any]:
+    """
+    Load a config from a YAML file as a plain nested dict.
+
+    Skips the ConfigDict conversion, which walks and wraps every sub-dict. Use for
+    read-only consumers such as flatten_config and diff_configs.
+    """
+    raw = _load_yaml(Path(path), cache)
+    return cast(dict[str, Any], raw) if raw is not None else {}
+
+
+def dump_yaml(data: Any) -> str:
+    """
+    Serialize plain data to a YAML string.
+    """
+    return yaml.dump(data, Dumper=SafeDumper)
 
 
 def save_config_to_yaml(config: ConfigDict, path: Union[str, Path]) -> None:
@@ -21,26 +115,33 @@ def save_config_to_yaml(config: ConfigDict, path: Union[str, Path]) -> None:
     """
     path = Path(path)
     with path.open("w") as f:
-        yaml.safe_dump(config.to_dict(), f)
+        yaml.dump(config.to_dict(), f, Dumper=SafeDumper)
 
 
 def flatten_config(
-    config: ConfigDict, parent_key: str = "", sep: str = "."
+    config: Union[ConfigDict, dict[str, Any]], parent_key: str = "", sep: str = "."
 ) -> dict[str, Any]:
     """
-    Flatten a nested ConfigDict into a flat dict with dot-separated keys.
+    Flatten a nested ConfigDict or dict into a flat dict with dot-separated keys.
 
     Example:
         ConfigDict({'a': ConfigDict({'b': 1})})
         => {'a.b': 1}
     """
     items: dict[str, Any] = {}
-    for k, v in config.items():
-        new_key = f"{parent_key}{sep}{k}" if parent_key else k
-        if isinstance(v, ConfigDict):
-            items.update(flatten_config(v, new_key, sep=sep))
-        else:
+    # Iterative depth-first walk; keeping one iterator per level preserves the
+    # key order of the recursive version.
+    stack = [(parent_key, iter(config.items()))]
+    while stack:
+        prefix, it = stack[-1]
+        for k, v in it:
+            new_key = f"{prefix}{sep}{k}" if prefix else k
+            if isinstance(v, _NESTED_TYPES):
+                stack.append((new_key, iter(v.items())))
+                break
             items[new_key] = v
+        else:
+            stack.pop()
     return items
 
 
@@ -67,8 +168,19 @@ def override_config(
     """
     Apply flat overrides to a config (not in-place).
     """
-    overrides_nested = unflatten_config(overrides, sep=sep)
-    updated_dict = _deep_update(config.to_dict(), overrides_nested)
+    updated_dict = config.to_dict()
+    for flat_key, value in overrides.items():
+        *parents, leaf = flat_key.split(sep)
+        d = updated_dict
+        for key in parents:
+            child = d.get(key)
+            if not isinstance(child, dict):
+                child = d[key] = {}
+            d = child
+        if isinstance(value, dict) and isinstance(d.get(leaf), dict):
+            _deep_update(d[leaf], value)
+        else:
+            d[leaf] = value
     return ConfigDict(updated_dict)
 
 
@@ -85,21 +197,57 @@ def _deep_update(cfg: dict[str, Any], updates: dict[str, Any]) -> dict[str, Any]
 
 
 def diff_configs(
-    config1: ConfigDict, config2: ConfigDict, sep: str = "."
+    config1: Union[ConfigDict, dict[str, Any]],
+    config2: Union[ConfigDict, dict[str, Any]],
+    sep: str = ".",
 ) -> dict[str, dict[str, Any]]:
     """
     Return a flat dict of keys that differ between two configs.
     """
-    flat1 = flatten_config(config1, sep=sep)
-    flat2 = flatten_config(config2, sep=sep)
     diff: dict[str, dict[str, Any]] = {}
-    all_keys = set(flat1) | set(flat2)
-    for k in all_keys:
-        if flat1.get(k) != flat2.get(k):
-            diff[k] = {"config1": flat1.get(k), "config2": flat2.get(k)}
+    _diff_walk(config1, config2, "", sep, diff)
     return diff
 
 
+def _diff_walk(
+    a: Union[ConfigDict, dict[str, Any]],
+    b: Union[ConfigDict, dict[str, Any]],
+    prefix: str,
+    sep: str,
+    out: dict[str, dict[str, Any]],
+) -> None:
+    """
+    Walk two configs side by side, writing differing leaves into `out`.
+    Missing keys compare as None, matching the flattened comparison.
+    """
+    # ConfigDict.keys() returns a list, not a set-like view, so pair values up
+    # from items() instead of building and unioning two key sets
+    pairs = [(k, v1, b.get(k)) for k, v1 in a.items()]
+    pairs += [(k, None, v2) for k, v2 in b.items() if k not in a]
+    for k, v1, v2 in pairs:
+        key = f"{prefix}{sep}{k}" if prefix else k
+        sub1 = isinstance(v1, _NESTED_TYPES)
+        sub2 = isinstance(v2, _NESTED_TYPES)
+        if sub1 and sub2:
+            _diff_walk(v1, v2, key, sep, out)
+        elif sub1 or sub2:
+            # Subtree on one side only: its leaves have no counterpart
+            if sub1:
+                for fk, fv in flatten_config(v1, key, sep=sep).items():
+                    if fv is not None:
+                        out[fk] = {"config1": fv, "config2": None}
+                if v2 is not None:
+                    out[key] = {"config1": None, "config2": v2}
+            else:
+                if v1 is not None:
+                    out[key] = {"config1": v1, "config2": None}
+                for fk, fv in flatten_config(v2, key, sep=sep).items():
+                    if fv is not None:
+                        out[fk] = {"config1": None, "config2": fv}
+        elif v1 != v2:
+            out[key] = {"config1": v1, "config2": v2}
+
+
 def validate_yaml_structure(path: Union[str, Path]) -> bool:
     """
     Validate that a YAML file is syntactically correct.
@@ -107,7 +255,7 @@ def validate_yaml_structure(path: Union[str, Path]) -> bool:
     path = Path(path)
     try:
         with path.open("r") as f:
-            yaml.safe_load(f)
+            yaml.load(f, Loader=SafeLoader)
         return True
     except yaml.YAMLError:
         return False
@@ -1,5 +1,5 @@
-from collections.abc import Mapping, Sequence
-from typing import Any, cast
+from collections.abc import Sequence
+from typing import Any, Final, cast
 
 from ml_collections import ConfigDict
 
@@ -7,14 +7,18 @@ from rem.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-REQUIRED_TOP_LEVEL_KEYS = [
+REQUIRED_TOP_LEVEL_KEYS: Final[list[str]] = [
     "experiment_name",
     "experiment_path",
     "experiment_class",
     "params",
 ]
-OPTIONAL_TOP_LEVEL_KEYS = ["sweep", "test", "slurm"]
-RESERVED_TOP_LEVEL_KEYS = REQUIRED_TOP_LEVEL_KEYS + OPTIONAL_TOP_LEVEL_KEYS
+OPTIONAL_TOP_LEVEL_KEYS: Final[list[str]] = ["sweep", "test", "slurm"]
+RESERVED_TOP_LEVEL_KEYS: Final[list[str]] = (
+    REQUIRED_TOP_LEVEL_KEYS + OPTIONAL_TOP_LEVEL_KEYS
+)
+# For O(1) membership checks
+_RESERVED_SET: Final[frozenset[str]] = frozenset(RESERVED_TOP_LEVEL_KEYS)
 
 
 def validate_config_structure(cfg: ConfigDict) -> None:
@@ -36,66 +40,68 @@ def validate_config_structure(cfg: ConfigDict) -> None:
 
     # Warn about unknown top-level keys
     for key in cfg:
-        if key not in RESERVED_TOP_LEVEL_KEYS:
+        if key not in _RESERVED_SET:
             logger.warning(f"Unknown top-level config key: '{key}'")
 
 
-def _is_nonstring_sequence(x: Any) -> bool:
-    return isinstance(x, Sequence) and not isinstance(x, (str, bytes, bytearray))
-
-
-# Need this so ConfigDict doesn't get rejected
-def _is_mapping(x: Any) -> bool:
-    return isinstance(x, Mapping) or isinstance(x, ConfigDict) or hasattr(x, "items")
-
-
-def _as_items(x: Any) -> Any:
-    return x.items() if hasattr(x, "items") else ()
+_STRING_TYPES = (str, bytes, bytearray)
 
 
 def _collect_sweep_params_keys(node: Any, *, path: str = "sweep") -> set[str]:
     """
-    Recursively validate the sweep specification and collect all parameter keys it references.
+    Validate the sweep specification and collect all parameter keys it references.
     This method supports three forms:
         1) Leaf grid dict: {"param_name": [v1, v2, ...]}
         2) Zip dict: {"zip": {param1: [...], param2: [...], ...}} (all lists same length)
         3) Grid list: {"grid": [ {param1: v1, param2: v2}, {...}, ... ]} (cartesian product of children)
         *4) Nested combinations of the above.
+    Nodes are visited depth-first with an explicit stack, so deeply nested sweeps
+    don't hit the recursion limit and errors surface in document order.
     Raises:
         ValueError if the sweep structure is invalid.
     """
-    if node is None or node is False:
-        return set()
-
     keys: set[str] = set()
+    stack: list[tuple[Any, str]] = [(node, path)]
 
-    # list is treated like a grid list (sequence of child nodes)
-    if isinstance(node, list):
-        for i, child in enumerate(node):
-            keys |= _collect_sweep_params_keys(child, path=f"{path}[{i}]")
-        return keys
+    while stack:
+        node, path = stack.pop()
+        if node is None or node is False:
+            continue
+
+        # list is treated like a grid list (sequence of child nodes)
+        if isinstance(node, list):
+            stack.extend(
+                (child, f"{path}[{i}]") for i, child in reversed(list(enumerate(node)))
+            )
+            continue
+
+        # Mapping/dict-like nodes (dict, ConfigDict, etc.). Checked via `items`
+        # so ConfigDict doesn't get rejected.
+        if not hasattr(node, "items"):
+            # Anything else is invalid
+            raise ValueError(f"Invalid sweep structure at {path}: {node!r}")
 
-    # Mapping/dict-like nodes (dict, ConfigDict, etc.)
-    if _is_mapping(node):
         # grid node
         if "grid" in node:
             grid = node["grid"]
             if not isinstance(grid, list):
                 raise ValueError(f"Expected 'grid' to be a list at {path}.")
-            for i, child in enumerate(grid):
-                keys |= _collect_sweep_params_keys(child, path=f"{path}.grid[{i}]")
-            return keys
+            stack.extend(
+                (child, f"{path}.grid[{i}]")
+                for i, child in reversed(list(enumerate(grid)))
+            )
+            continue
 
         # zip node
         if "zip" in node:
             z = node["zip"]
-            if not _is_mapping(z):
+            if not hasattr(z, "items"):
                 raise ValueError(
                     f"Expected {path}.zip to be a mapping of {{param: list}}."
                 )
             lengths: set[int] = set()
-            for k, v in _as_items(z):
-                if not _is_nonstring_sequence(v):
+            for k, v in z.items():
+                if not isinstance(v, Sequence) or isinstance(v, _STRING_TYPES):
                     raise ValueError(
                         f"Expected {path}.zip.{k} to be a list or tuple of values."
                     )
@@ -105,19 +111,17 @@ def _collect_sweep_params_keys(node: Any, *, path: str = "sweep") -> set[str]:
                 raise ValueError(
                     f"All lists in {path}.zip must have equal lengths; got lengths={sorted(lengths)}"
                 )
-            return keys
+            continue
 
         # leaf grid dict (param -> list/tuple of values)
-        for k, v in _as_items(node):
-            if not _is_nonstring_sequence(v):
+        for k, v in node.items():
+            if not isinstance(v, Sequence) or isinstance(v, _STRING_TYPES):
                 raise ValueError(
                     f"Expected {path}.{k} to be a list or tuple of values."
                 )
             keys.add(str(k))
-        return keys
 
-    # Anything else is invalid
-    raise ValueError(f"Invalid sweep structure at {path}: {node!r}")
+    return keys
 
 
 def check_sweep_keys(cfg: ConfigDict) -> None:
@@ -145,7 +149,7 @@ def check_reserved_keys_in_params(cfg: ConfigDict) -> None:
     """
     params = cast(dict[str, Any], cfg.get("params", {}))
     for key in params:
-        if key in RESERVED_TOP_LEVEL_KEYS:
+        if key in _RESERVED_SET:
             raise ValueError(
                 f"'{key}' is a reserved top-level key and cannot appear inside 'params'."
             )
@@ -1,21 +1,51 @@
-import json
-import tempfile
-from dataclasses import asdict, dataclass, field, is_dataclass
-from datetime import datetime, timezone
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass, field, fields, is_dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional, Type, TypeVar, Union, cast
+from types import TracebackType
+from typing import Any, Generic, Optional, Type, TypeVar, Union, cast
 
+from rem.constants import MANIFEST_EVENTS_SUFFIX
 from rem.core.status import TERMINAL_STATUSES, VALID_STATUSES
+from rem.utils.files import write_files
 from rem.utils.lock import FileLock
 from rem.utils.logger import get_logger
+from rem.utils.serialization import dumps, loads
 
 logger = get_logger(__name__)
 
 ManifestType = TypeVar("ManifestType", bound="BaseManifest")
 
 
+# Second-granularity prefix shared by all stamps within the same second
+_stamp_prefix: tuple[int, str] = (-1, "")
+
+
 def utc_now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat()
+    """
+    Current UTC time as an ISO 8601 string with microseconds and a +00:00 offset.
+
+    Built from time.time_ns() rather than datetime, reformatting the date/time
+    part only when the second changes.
+    """
+    global _stamp_prefix
+    sec, ns = divmod(time.time_ns(), 1_000_000_000)
+    cached_sec, prefix = _stamp_prefix
+    if sec != cached_sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+        _stamp_prefix = (sec, prefix)
+    return f"{prefix}.{ns // 1000:06d}+00:00"
+
+
+def _get_events_path(path: Path) -> Path:
+    return path.with_suffix(MANIFEST_EVENTS_SUFFIX)
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> tuple[str, ...]:
+    return tuple(f.name for f in fields(cls))
 
 
 class BaseManifest:
@@ -26,17 +56,69 @@ class BaseManifest:
             setattr(self, "timestamp_updated", utc_now_iso())
         path.parent.mkdir(parents=True, exist_ok=True)
         with FileLock(path):
-            with tempfile.NamedTemporaryFile(
-                "w", delete=False, dir=path.parent, suffix=".tmp"
-            ) as tmp:
-                json.dump(asdict(cast(Any, self)), tmp, indent=2)
-                tmp_path = Path(tmp.name)
-            tmp_path.replace(path)
+            # The lock already excludes other writers; the pid/thread suffix only
+            # keeps a writer that broke a stale lock off the holder's temp file
+            tmp_path = path.with_name(
+                f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+            )
+            # A shallow field dict is enough for dumps, which only reads the values;
+            # asdict would deep-copy every nested dict and list first
+            data = {name: getattr(self, name) for name in _field_names(type(self))}
+            write_files([(tmp_path, dumps(data, indent=True))])
+            # The full manifest includes everything in the event log. Dropped
+            # before the replace, so that a concurrent load() never applies the
+            # old log on top of the new manifest
+            _get_events_path(path).unlink(missing_ok=True)
+            os.replace(tmp_path, path)
         logger.info(f"Saved manifest to {path}")
 
+    def log_event(self, path: Path, updates: dict[str, Any]) -> None:
+        """
+        Apply updates in memory and append them to the manifest's event log
+        instead of rewriting the manifest. The log is folded back in on load()
+        and cleared by the next save(), so manifest.json on its own lags behind
+        until then; read manifests through load().
+
+        Each record is a single small O_APPEND write, so no temp file is needed.
+        The append still takes the manifest's lock: otherwise it could land just
+        before a concurrent save() clears the log, and be lost.
+
+        Like save(), only dataclass fields are written; other keys stay on the
+        in-memory instance, since load() could not pass them back to cls().
+        """
+        for k, v in updates.items():
+            setattr(self, k, v)
+        names = _field_names(cast(type, type(self)))
+        record = {k: v for k, v in updates.items() if k in names}
+        if hasattr(self, "timestamp_updated"):
+            record["timestamp_updated"] = utc_now_iso()
+            setattr(self, "timestamp_updated", record["timestamp_updated"])
+        with FileLock(path):
+            with _get_events_path(path).open("ab") as f:
+                f.write(dumps(record) + b"\n")
+        logger.info(f"Logged manifest event to {path}: {updates}")
+
     @classmethod
     def load(cls: Type[ManifestType], path: Path) -> ManifestType:
-        data = json.loads(path.read_text())
+        data = loads(path.read_bytes())
+        events_path = _get_events_path(path)
+        try:
+            # Read without an exists() check, since a concurrent save() may
+            # remove the log in between
+            events = events_path.read_bytes().splitlines()
+        except FileNotFoundError:
+            events = []
+        names = _field_names(cast(type, cls))
+        for line in events:
+            try:
+                event = loads(line)
+            except ValueError:
+                # Torn trailing write from a crashed process
+                logger.warning(f"Skipping unreadable event in {events_path}")
+                continue
+            # Logs written before log_event filtered its records may hold keys
+            # that are not fields
+            data.update((k, v) for k, v in event.items() if k in names)
         logger.info(f"Loaded manifest from {path}")
         return cls(**data)  # type: ignore
 
@@ -89,6 +171,63 @@ class GroupManifest(BaseManifest):
     status: str = "PENDING"
 
 
+class ManifestHandle(Generic[ManifestType]):
+    """
+    Load a manifest once, apply updates in memory and persist them on exit.
+
+    Avoids a full load/save round-trip for every status change when the same
+    manifest is updated several times in a row. Call flush() to persist an
+    intermediate state (e.g. RUNNING) without leaving the context. Non-terminal
+    states are appended to the manifest's event log; the full manifest is only
+    rewritten once it reaches a terminal status (or has no status field).
+    Nothing is written if the block exits with an exception.
+    """
+
+    def __init__(self, path: Path, manifest_type: Type[ManifestType]) -> None:
+        self.path = path
+        self.manifest_type = manifest_type
+        self._kind = manifest_type.__name__.removesuffix("Manifest").lower()
+        self._manifest: Optional[ManifestType] = None
+        self._pending: dict[str, Any] = {}
+
+    @property
+    def manifest(self) -> ManifestType:
+        if self._manifest is None:
+            self._manifest = self.manifest_type.load(self.path)
+        return self._manifest
+
+    def update(self, **updates: Any) -> None:
+        status = updates.get("status")
+        if "status" in updates and status not in VALID_STATUSES:
+            raise ValueError(f"Invalid status '{status}' for {self._kind} manifest.")
+        manifest = self.manifest
+        for k, v in updates.items():
+            setattr(manifest, k, v)
+        self._pending.update(updates)
+
+    def flush(self) -> None:
+        if not self._pending or self._manifest is None:
+            return
+        status = getattr(self._manifest, "status", None)
+        if status is None or status in TERMINAL_STATUSES:
+            self._manifest.save(self.path)
+        else:
+            self._manifest.log_event(self.path, self._pending)
+        self._pending = {}
+
+    def __enter__(self) -> "ManifestHandle[ManifestType]":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        if exc_type is None:
+            self.flush()
+
+
 def init_rep_manifest(path: Path, manifest: RepManifest) -> None:
     manifest.save(path)
     logger.info(f"Initialized rep manifest at {path}")
@@ -105,32 +244,20 @@ def init_group_manifest(path: Path, manifest: GroupManifest) -> None:
 
 
 def update_rep_manifest(path: Path, updates: dict[str, Any]) -> None:
-    rep = RepManifest.load(path)
-    for k, v in updates.items():
-        if k == "status" and v not in VALID_STATUSES:
-            raise ValueError(f"Invalid status '{v}' for rep manifest.")
-        setattr(rep, k, v)
-    rep.save(path)
+    with ManifestHandle(path, RepManifest) as handle:
+        handle.update(**updates)
     logger.info(f"Updated rep manifest at {path} with {updates}")
 
 
 def update_sweep_manifest(path: Path, updates: dict[str, Any]) -> None:
-    sweep = SweepManifest.load(path)
-    for k, v in updates.items():
-        if k == "status" and v not in VALID_STATUSES:
-            raise ValueError(f"Invalid status '{v}' for sweep manifest.")
-        setattr(sweep, k, v)
-    sweep.save(path)
+    with ManifestHandle(path, SweepManifest) as handle:
+        handle.update(**updates)
     logger.info(f"Updated sweep manifest at {path} with {updates}")
 
 
 def update_group_manifest(path: Path, updates: dict[str, Any]) -> None:
-    group = GroupManifest.load(path)
-    for k, v in updates.items():
-        if k == "status" and v not in VALID_STATUSES:
-            raise ValueError(f"Invalid status '{v}' for group manifest.")
-        setattr(group, k, v)
-    group.save(path)
+    with ManifestHandle(path, GroupManifest) as handle:
+        handle.update(**updates)
     logger.info(f"Updated group manifest at {path} with {updates}")
 
 
@@ -145,28 +272,24 @@ def load_manifest(path: Path, manifest_type: Type[ManifestType]) -> ManifestType
     return manifest
 
 
-def summarize_sweep_status(rep_entries: list[dict[str, Any]]) -> str:
-    statuses = [r["status"] for r in rep_entries]
-    if all(s == "COMPLETED" for s in statuses):
+def _summarize_statuses(statuses: set[str]) -> str:
+    # Decided on the set of distinct statuses, built in a single pass
+    if statuses <= {"COMPLETED"}:
         return "COMPLETED"
-    elif all(s == "PENDING" for s in statuses):
+    elif statuses == {"PENDING"}:
         return "PENDING"
-    elif any(s not in TERMINAL_STATUSES for s in statuses):
+    elif not statuses <= TERMINAL_STATUSES:
         return "RUNNING"
     else:
         return "PARTIAL_COMPLETION"
 
 
+def summarize_sweep_status(rep_entries: list[dict[str, Any]]) -> str:
+    return _summarize_statuses({r["status"] for r in rep_entries})
+
+
 def summarize_group_status(sweep_manifests: list[SweepManifest]) -> str:
-    statuses = [sweep.status for sweep in sweep_manifests]
-    if all(s == "COMPLETED" for s in statuses):
-        return "COMPLETED"
-    elif all(s == "PENDING" for s in statuses):
-        return "PENDING"
-    elif any(s not in TERMINAL_STATUSES for s in statuses):
-        return "RUNNING"
-    else:
-        return "PARTIAL_COMPLETION"
+    return _summarize_statuses({sweep.status for sweep in sweep_manifests})
 
 
 def summarize_group_patches(rep_manifests: list[RepManifest]) -> list[dict[str, Any]]:
@@ -1,4 +1,7 @@
-import json
+import os
+import sys
+import threading
+import weakref
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Literal, Optional, cast
@@ -7,6 +10,7 @@ from rem.core.status import VALID_STATUSES, is_terminal
 from rem.utils.lock import FileLock
 from rem.utils.logger import get_logger
 from rem.utils.paths import get_default_events_path, get_results_dir
+from rem.utils.serialization import dumps, loads, loads_lines
 
 logger = get_logger(__name__)
 
@@ -17,55 +21,245 @@ EventType = Literal[
     "UPDATE_STATUS",
 ]
 
-VALID_EVENT_TYPES: set[EventType] = {
-    "CREATE_GROUP",
-    "PATCH_GROUP",
-    "SUBMIT_SWEEP",
-    "UPDATE_STATUS",
-}
+VALID_EVENT_TYPES: frozenset[EventType] = frozenset(
+    {
+        "CREATE_GROUP",
+        "PATCH_GROUP",
+        "SUBMIT_SWEEP",
+        "UPDATE_STATUS",
+    }
+)
+
+# O_CLOEXEC keeps the descriptor out of forked/exec'd workers; O_BINARY disables
+# newline translation on Windows. Either may be missing on a given platform.
+_APPEND_FLAGS = (
+    os.O_WRONLY
+    | os.O_APPEND
+    | os.O_CREAT
+    | getattr(os, "O_CLOEXEC", 0)
+    | getattr(os, "O_BINARY", 0)
+)
+
+_MISSING = object()
+_REQUIRED_EVENT_KEYS = frozenset({"group_id", "timestamp"})
+
+# Window size for reading events.jsonl backwards from the end
+_TAIL_CHUNK_SIZE = 1 << 16
+
+# Values that repeat across many events; interned so that a long registry keeps
+# one copy of each rather than one per parsed event
+_INTERNED_EVENT_KEYS = ("type", "status", "group_id", "sweep_id", "rep_id")
 
 
 class RegistryManager:
-    def __init__(self, events_path: Optional[Path] = None) -> None:
+    def __init__(
+        self,
+        events_path: Optional[Path] = None,
+        batch_size: int = 1,
+        max_delay: Optional[float] = None,
+        fsync: bool = False,
+    ) -> None:
+        """
+        Args:
+            events_path (Path): Location of events.jsonl (defaults to the results dir).
+            batch_size (int): Number of events buffered in memory before they are
+                written out in a single append. The default of 1 writes through;
+                callers using larger batches must call flush() when done.
+            max_delay (float): Seconds after which a partial batch is flushed from
+                a background timer, so other readers never lag far behind.
+            fsync (bool): fsync the events file after each flush, so durability
+                costs one fsync per batch rather than per event.
+        """
         if events_path is None:
             events_path = get_default_events_path()
         self.events_path = events_path
         self.events_path.parent.mkdir(parents=True, exist_ok=True)
+        self.batch_size = max(batch_size, 1)
+        self.max_delay = max_delay
+        self.fsync = fsync
+        self._pending: list[tuple[dict[str, Any], bytes]] = []
+        # Armed when the first event of a batch is buffered, if max_delay is set
+        self._flush_timer: Optional[threading.Timer] = None
+        # Append descriptor kept open across flushes; opened lazily on first write
+        self._fd: Optional[int] = None
+        self._fd_finalizer: Optional[weakref.finalize[[int], RegistryManager]] = None
+        self._write_lock = threading.RLock()
         self._events: Optional[list[dict[str, Any]]] = None
+        # Byte offset up to which events.jsonl has been parsed into _events, and
+        # the (st_dev, st_ino) of the file those bytes came from
+        self._offset = 0
+        self._file_id: Optional[tuple[int, int]] = None
+        # Indexes over _events, maintained as events are loaded or appended
+        self._by_group: dict[str, list[int]] = {}
+        self._latest_status: dict[str, str] = {}
 
     def append_event(self, event: dict[str, Any]) -> None:
         """
         Append a validated event to the events.jsonl file.
         """
         self._validate_event(event)
-        with FileLock(self.events_path):
-            with self.events_path.open("a") as f:
-                f.write(json.dumps(event) + "\n")
+        line = dumps(event) + b"\n"
+        with self._write_lock:
+            self._pending.append((dict(event), line))
+            if len(self._pending) >= self.batch_size:
+                self.flush()
+            elif self.max_delay is not None and self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.max_delay, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
         logger.info(
             f"Appended event: {event['type']} for group {event.get('group_id', '?')}"
         )
 
+    def flush(self) -> None:
+        """
+        Write all buffered events to the events.jsonl file in one append.
+        """
+        with self._write_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, []
+            data = b"".join(line for _, line in pending)
+            with FileLock(self.events_path):
+                st = self._write(data)
+                file_id = (st.st_dev, st.st_ino)
+                # If nobody else appended since our last read, keep the cache warm
+                # instead of forcing the next load to go back to disk
+                if (
+                    self._events is not None
+                    and st.st_size == self._offset
+                    and self._file_id in (None, file_id)
+                ):
+                    self._extend_events([event for event, _ in pending])
+                    self._offset += len(data)
+                    self._file_id = file_id
+        logger.debug(f"Flushed {len(pending)} events to {self.events_path}")
+
+    def close(self) -> None:
+        """
+        Flush buffered events and release the append handle.
+        """
+        with self._write_lock:
+            self.flush()
+            self._close_fd()
+
+    def _close_fd(self) -> None:
+        # The finalizer closes the descriptor at most once, even if close() runs
+        # again or the manager is garbage collected afterwards
+        if self._fd_finalizer is not None:
+            self._fd_finalizer()
+        self._fd = None
+        self._fd_finalizer = None
+
+    def _write(self, data: bytes) -> os.stat_result:
+        """
+        Append data through the persistent descriptor and return the file's stat
+        from before the write. Must be called with the FileLock held.
+        """
+        st = os.fstat(self._fd) if self._fd is not None else None
+        # Reopen if the file was deleted or replaced since it was opened
+        if self._fd is None or st is None or st.st_nlink == 0:
+            self._close_fd()
+            fd = os.open(self.events_path, _APPEND_FLAGS, 0o644)
+            self._fd = fd
+            self._fd_finalizer = weakref.finalize(self, os.close, fd)
+            st = os.fstat(fd)
+        view = memoryview(data)
+        while view:
+            view = view[os.write(self._fd, view) :]
+        if self.fsync:
+            os.fsync(self._fd)
+        return st
+
     def load_events(self, force_reload: bool = False) -> list[dict[str, Any]]:
         """
         Load all events from the file into memory (with caching).
+
+        Subsequent reloads only parse bytes appended since the last read, and skip
+        opening the file if nothing was appended; it is re-read from the start
+        only if it was replaced or shrank.
         """
-        if self._events is None or force_reload:
-            if not self.events_path.exists():
-                logger.warning(f"No events file found at {self.events_path}")
-                self._events = []
+        self.flush()
+        if self._events is not None and not force_reload:
+            return self._events
+        if not self.events_path.exists():
+            logger.warning(f"No events file found at {self.events_path}")
+            return self._reset_cache()
+        events = self._read_new_events()
+        logger.info(f"Loaded {len(events)} events from {self.events_path}")
+        return events
+
+    def _read_new_events(self) -> list[dict[str, Any]]:
+        st = os.stat(self.events_path)
+        if (
+            self._events is not None
+            and (st.st_dev, st.st_ino) == self._file_id
+            and st.st_size == self._offset
+        ):
+            return self._events
+        with self.events_path.open("rb") as f:
+            st = os.fstat(f.fileno())
+            file_id = (st.st_dev, st.st_ino)
+            if (
+                self._events is None
+                or file_id != self._file_id
+                or st.st_size < self._offset
+            ):
+                events = self._reset_cache()
             else:
-                with self.events_path.open("r") as f:
-                    self._events = [json.loads(line) for line in f if line.strip()]
-                logger.info(
-                    f"Loaded {len(self._events)} events from {self.events_path}"
-                )
+                events = self._events
+            self._file_id = file_id
+            f.seek(self._offset)
+            data = f.read()
+
+        # Leave a torn trailing line (concurrent writer) for the next read, unless
+        # it already parses on its own (e.g. a file without a final newline)
+        end = data.rfind(b"\n") + 1
+        tail = data[end:]
+        if tail.strip():
+            try:
+                self._extend_events(loads_lines(data))
+                self._offset += len(data)
+                return events
+            except ValueError:
+                pass
+        self._extend_events(loads_lines(data[:end]))
+        self._offset += end
+        return events
+
+    def _reset_cache(self) -> list[dict[str, Any]]:
+        self._events = []
+        self._offset = 0
+        self._file_id = None
+        self._by_group = {}
+        self._latest_status = {}
         return self._events
 
+    def _extend_events(self, new_events: list[dict[str, Any]]) -> None:
+        events = self._events if self._events is not None else self._reset_cache()
+        start = len(events)
+        events.extend(new_events)
+        for i, event in enumerate(new_events, start):
+            for key in _INTERNED_EVENT_KEYS:
+                value = event.get(key)
+                if type(value) is str:
+                    event[key] = sys.intern(value)
+            group_id = event.get("group_id")
+            if group_id is None:
+                continue
+            self._by_group.setdefault(group_id, []).append(i)
+            if event.get("type") == "UPDATE_STATUS" and "status" in event:
+                self._latest_status[group_id] = event["status"]
+
     def get_group_history(self, group_id: str) -> list[dict[str, Any]]:
         """
         Return all events pertaining to a specific group.
         """
-        events = [e for e in self.load_events() if e.get("group_id") == group_id]
+        all_events = self.load_events()
+        events = [all_events[i] for i in self._by_group.get(group_id, ())]
         logger.debug(f"Found {len(events)} events for group {group_id}")
         return events
 
@@ -73,13 +267,54 @@ class RegistryManager:
         """
         Return the latest known status for the given group.
         """
-        for event in reversed(self.load_events()):
-            if event.get("group_id") == group_id and event["type"] == "UPDATE_STATUS":
-                logger.debug(f"Latest status for {group_id} is {event['status']}")
-                return cast(str, event["status"])
+        if self._events is None:
+            # Cold cache: the latest status is usually near the end of the log,
+            # so scan backwards rather than parsing the whole file
+            self.flush()
+            status = self._scan_latest_status(group_id)
+        else:
+            self.load_events()
+            status = self._latest_status.get(group_id)
+        if status is not None:
+            logger.debug(f"Latest status for {group_id} is {status}")
+            return status
         logger.info(f"No status found for group {group_id}")
         return None
 
+    def _scan_latest_status(self, group_id: str) -> Optional[str]:
+        """
+        Read events.jsonl backwards in chunks and return the status of the last
+        UPDATE_STATUS event for group_id, without populating the event cache.
+        """
+        if not self.events_path.exists():
+            return None
+        needle = group_id.encode("utf-8")
+        with self.events_path.open("rb") as f:
+            pos = f.seek(0, os.SEEK_END)
+            carry = b""
+            while pos > 0:
+                step = min(_TAIL_CHUNK_SIZE, pos)
+                pos -= step
+                f.seek(pos)
+                lines = (f.read(step) + carry).split(b"\n")
+                # Unless we reached the start of the file, the first line may be
+                # cut off; keep it to prepend to the next (earlier) chunk
+                carry = lines[0] if pos > 0 else b""
+                for line in reversed(lines[1:] if pos > 0 else lines):
+                    if needle not in line:
+                        continue
+                    try:
+                        event = loads(line)
+                    except ValueError:
+                        continue  # torn or corrupt line
+                    if (
+                        event.get("group_id") == group_id
+                        and event.get("type") == "UPDATE_STATUS"
+                        and "status" in event
+                    ):
+                        return cast(str, event["status"])
+        return None
+
     def is_group_terminal(self, group_id: str) -> bool:
         """
         Check if the group's current status is terminal.
@@ -98,20 +333,23 @@ class RegistryManager:
         if not isinstance(event, dict):
             raise ValueError("Event must be a dictionary.")
 
-        if "type" not in event:
+        # One lookup per field: "type" and "status" are fetched with get() and the
+        # presence checks for the remaining keys are a single set comparison
+        event_type = event.get("type", _MISSING)
+        if event_type is _MISSING:
             raise ValueError("Event must include 'type' field.")
 
-        if event["type"] not in VALID_EVENT_TYPES:
-            raise ValueError(f"Invalid event type: {event['type']}")
-
-        if "group_id" not in event:
-            raise ValueError("Event must include 'group_id'.")
+        if event_type not in VALID_EVENT_TYPES:
+            raise ValueError(f"Invalid event type: {event_type}")
 
-        if "timestamp" not in event:
+        if not _REQUIRED_EVENT_KEYS <= event.keys():
+            if "group_id" not in event:
+                raise ValueError("Event must include 'group_id'.")
             raise ValueError("Event must include 'timestamp' field.")
 
-        if event["type"] == "UPDATE_STATUS":
-            if "status" not in event:
+        if event_type == "UPDATE_STATUS":
+            status = event.get("status", _MISSING)
+            if status is _MISSING:
                 raise ValueError("UPDATE_STATUS events must include a 'status' field.")
-            if event["status"] not in VALID_STATUSES:
-                raise ValueError(f"Invalid status: {event['status']}")
+            if status not in VALID_STATUSES:
+                raise ValueError(f"Invalid status: {status}")
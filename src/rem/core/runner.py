@@ -1,33 +1,36 @@
 from __future__ import annotations
 
 import importlib
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import asdict, dataclass
 from datetime import datetime
-from glob import glob
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Mapping, Optional, Union, cast
-
-import yaml
-from ml_collections import ConfigDict
+from typing import TYPE_CHECKING, Any, Mapping, Optional, Union, cast
 
 from rem.constants import (
     CONFIG_FLAT_FILENAME,
+    EVENT_BATCH_SIZE,
+    EVENT_MAX_DELAY,
     MANIFEST_FILENAME,
     REP_PREFIX,
+    STAGING_MAX_WORKERS,
     SUBCONFIG_FILENAME,
     SWEEP_PREFIX,
 )
 from rem.core.config import (
+    dump_yaml,
     flatten_config,
     load_config_from_yaml,
     override_config,
-    save_config_to_yaml,
     to_dict,
 )
 from rem.core.config_validation import validate_config
 from rem.core.experiment import ExperimentBase
 from rem.core.manifest import (
     GroupManifest,
+    ManifestHandle,
     RepManifest,
     SweepManifest,
     init_group_manifest,
@@ -38,12 +41,14 @@ from rem.core.manifest import (
     update_group_manifest,
     update_rep_manifest,
     update_sweep_manifest,
+    utc_now_iso,
 )
 from rem.core.registry import RegistryManager
 from rem.core.stamp import create_group_stamp, format_rep_id, parse_group_id
-from rem.core.status import VALID_STATUSES, is_terminal
+from rem.core.status import TERMINAL_STATUSES, VALID_STATUSES, is_terminal
 from rem.core.sweeps import get_sweep_elements
-from rem.utils.logger import get_logger
+from rem.utils.files import write_files
+from rem.utils.logger import current_log_file, get_logger, log_to_file
 from rem.utils.paths import (
     get_default_events_path,
     get_group_dir,
@@ -53,31 +58,64 @@ from rem.utils.paths import (
     get_sweep_dir,
     get_sweep_manifest_path,
 )
+from rem.utils.serialization import dumps
 from rem.utils.ulid import timestamp_from_ulid
 
+if TYPE_CHECKING:
+    from ml_collections import ConfigDict
+
 logger = get_logger(__name__)
 
 
 def _as_plain_dict(obj: Any) -> dict[str, Any]:
-    if isinstance(obj, ConfigDict):
+    # Duck-typed so ConfigDict is only needed for annotations
+    if hasattr(obj, "to_dict"):
         return to_dict(obj)
     if isinstance(obj, Mapping):
         return dict(obj)
     return {}
 
 
+@lru_cache(maxsize=None)
 def _resolve_group_date_from_group_id(group_id: str) -> datetime:
     """
     Derive a timezone-aware UTC datetime from the group_id (which embeds ULID).
     The group directory helpers expect a date/datetime, while our stamp helper
     returns a display date string. We reconstruct the ULID from the group_id and
-    then recover the original timestamp.
+    then recover the original timestamp. Cached, as the mapping is pure and the
+    stage/run helpers resolve it for every sweep and rep.
     """
     ulid_str = parse_group_id(group_id)  # 26-char
     return timestamp_from_ulid(ulid_str)
 
 
+def _list_subdirs(parent: Path, prefix: str) -> list[Path]:
+    """
+    Sorted subdirectories of parent whose names start with prefix. Uses scandir so
+    the directory check comes from the dirent instead of a stat per entry.
+    """
+    with os.scandir(parent) as it:
+        names = sorted(e.name for e in it if e.name.startswith(prefix) and e.is_dir())
+    return [parent / name for name in names]
+
+
+def _load_sweep_manifests(group_dir: Path) -> list[SweepManifest]:
+    """
+    Load the manifest of every staged sweep in a group directory.
+    """
+    manifests = []
+    for sweep_dir in _list_subdirs(group_dir, SWEEP_PREFIX):
+        try:
+            manifests.append(SweepManifest.load(sweep_dir / MANIFEST_FILENAME))
+        except FileNotFoundError:
+            continue
+    return manifests
+
+
+@lru_cache(maxsize=None)
 def _import_experiment_class(module_path: str, class_name: str) -> type[ExperimentBase]:
+    # Memoized: every rep of a group resolves the same class. Failed lookups
+    # raise and are not cached, so each rep still records its own crash.
     mod = importlib.import_module(module_path)
     cls = getattr(mod, class_name)
     if not issubclass(cls, ExperimentBase):
@@ -136,7 +174,7 @@ def stage_group(
             {
                 "type": "CREATE_GROUP",
                 "group_id": group_id,
-                "timestamp": datetime.now().isoformat() + "Z",
+                "timestamp": utc_now_iso(),
             }
         )
 
@@ -178,7 +216,7 @@ def stage_sweep(
                 "type": "SUBMIT_SWEEP",
                 "group_id": group_id,
                 "sweep_id": sweep_id,
-                "timestamp": datetime.now().isoformat() + "Z",
+                "timestamp": utc_now_iso(),
                 "num_reps": len(reps_meta),
                 "parameters": parameter_overrides,
             }
@@ -194,9 +232,11 @@ def stage_rep(
     rep_id: str,
     sweep_overrides: dict[str, Any],
     test: bool = False,
+    write_flat_config: bool = False,
 ) -> tuple[Path, Path]:
     """
     Create the rep directory, write subconfig and init rep manifest.
+    With write_flat_config, also write a flattened copy of the subconfig.
     Returns (rep_dir, subconfig_path).
     """
     group_dt = _resolve_group_date_from_group_id(group_id)
@@ -205,18 +245,19 @@ def stage_rep(
 
     resolved_cfg = prepare_config_for_run(base_cfg, sweep_overrides)
     subconfig_path = rep_dir.joinpath(SUBCONFIG_FILENAME)
-    save_config_to_yaml(resolved_cfg, subconfig_path)
+    files = [(subconfig_path, dump_yaml(resolved_cfg.to_dict()).encode("utf-8"))]
 
     # Optional: stash a flat dump for easy debugging/diffing
-    flat_cfg_path = rep_dir.joinpath(CONFIG_FLAT_FILENAME)
-    try:
-        flat = flatten_config(resolved_cfg)
-        with open(flat_cfg_path, "w") as f:
-            yaml.safe_dump({k: v for k, v in flat.items()}, f)
-    except Exception as e:
-        logger.warning(
-            f"Failed to write flat config for {rep_id} at {flat_cfg_path}: {e}"
-        )
+    if write_flat_config:
+        flat_cfg_path = rep_dir.joinpath(CONFIG_FLAT_FILENAME)
+        try:
+            flat = flatten_config(resolved_cfg)
+            files.append((flat_cfg_path, dumps(flat, indent=True) + b"\n"))
+        except Exception as e:
+            logger.warning(
+                f"Failed to write flat config for {rep_id} at {flat_cfg_path}: {e}"
+            )
+    write_files(files)
 
     rm = RepManifest(
         rep_id=rep_id,
@@ -233,6 +274,22 @@ def stage_rep(
     return rep_dir, subconfig_path
 
 
+def _stage_reps(tasks: list[dict[str, Any]]) -> None:
+    """
+    Run stage_rep for each set of keyword arguments. Staging is dominated by
+    filesystem I/O, so reps are staged on a thread pool when there is more than one.
+    """
+    if len(tasks) <= 1:
+        for task in tasks:
+            stage_rep(**task)
+        return
+    max_workers = min(STAGING_MAX_WORKERS, len(tasks), (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Consume the iterator so the first failure is re-raised here
+        for _ in executor.map(lambda task: stage_rep(**task), tasks):
+            pass
+
+
 def run_single_rep(
     *,
     cfg: ConfigDict,
@@ -242,39 +299,58 @@ def run_single_rep(
     experiment_path: str,
     experiment_class: str,
     test: bool = False,
-) -> None:
+) -> str:
+    """
+    Run one staged rep, recording its progress in the rep manifest.
+    Returns the final rep status.
+    """
     group_dt = _resolve_group_date_from_group_id(group_id)
     rep_manifest_path = get_rep_manifest_path(
         group_id, group_dt, sweep_id, rep_id, test=test
     )
 
-    # Mark as RUNNING
-    update_rep_manifest(
-        rep_manifest_path,
-        {"status": "RUNNING", "timestamp_start": datetime.now().isoformat() + "Z"},
-    )
+    # Keep the rep manifest in memory for the whole run; it is loaded once and
+    # only written for the RUNNING and final status
+    with ManifestHandle(rep_manifest_path, RepManifest) as rep:
+        # Mark as RUNNING
+        rep.update(status="RUNNING", timestamp_start=utc_now_iso())
+        rep.flush()
+
+        prior_artifacts = rep.manifest.artifacts
+        # Instantiate experiment
+        try:
+            expcls = _import_experiment_class(experiment_path, experiment_class)
+            experiment = expcls(cfg)
+            results = experiment.run()
+            artifacts = results if isinstance(results, dict) else {"results": results}
+
+            rep.update(
+                status="COMPLETED",
+                timestamp_end=utc_now_iso(),
+                artifacts=artifacts,
+            )
+            # Written here rather than on exit, so that artifacts which can't be
+            # serialized mark the rep CRASHED like any other failure
+            rep.flush()
+        except Exception as e:
+            logger.exception(f"Experiment {rep_id} in sweep {sweep_id} crashed: {e}")
+            rep.update(
+                status="CRASHED", timestamp_end=utc_now_iso(), artifacts=prior_artifacts
+            )
+    return rep.manifest.status
 
-    # Instantiate experiment
-    try:
-        expcls = _import_experiment_class(experiment_path, experiment_class)
-        experiment = expcls(cfg)
-        results = experiment.run()
-        artifacts = results if isinstance(results, dict) else {"results": results}
 
-        update_rep_manifest(
-            rep_manifest_path,
-            {
-                "status": "COMPLETED",
-                "timestamp_end": datetime.now().isoformat() + "Z",
-                "artifacts": artifacts,
-            },
-        )
-    except Exception as e:
-        logger.exception(f"Experiment {rep_id} in sweep {sweep_id} crashed: {e}")
-        update_rep_manifest(
-            rep_manifest_path,
-            {"status": "CRASHED", "timestamp_end": datetime.now().isoformat() + "Z"},
-        )
+def _init_rep_worker(log_file: Optional[Path], level: int) -> None:
+    # Spawned workers start with an unconfigured logger; forked ones already write
+    # to the parent's log file, which makes log_to_file a no-op
+    get_logger(level=level)
+    if log_file is not None:
+        log_to_file(log_file)
+
+
+def _run_rep_job(job: dict[str, Any]) -> str:
+    # Module-level so a process pool can pickle it
+    return run_single_rep(**job)
 
 
 def run_local(
@@ -325,11 +401,33 @@ class MainRunner:
         test: bool = False,
         dryrun: bool = False,
         events_path: Path | None = None,
+        write_flat_config: bool = False,
+        max_workers: int = 1,
+        fsync_events: bool = False,
+        cache_config: bool = False,
     ) -> None:
+        """
+        Args:
+            max_workers (int): Number of processes running the reps of a new group.
+                With the default of 1, reps run one at a time in this process.
+            fsync_events (bool): fsync the registry after each flushed batch of
+                events, so they survive a power loss or host crash.
+            cache_config (bool): Keep the parsed experiment config in a sidecar
+                next to it (see load_config_from_yaml), so that repeated runs of
+                an unchanged config skip the YAML parse.
+        """
         self.test = test
         self.dryrun = dryrun
+        self.write_flat_config = write_flat_config
+        self.cache_config = cache_config
+        self.max_workers = max(max_workers, 1)
         events_path = events_path or get_default_events_path(test=self.test)
-        self.registry = RegistryManager(events_path=events_path)
+        self.registry = RegistryManager(
+            events_path=events_path,
+            batch_size=EVENT_BATCH_SIZE,
+            max_delay=EVENT_MAX_DELAY,
+            fsync=fsync_events,
+        )
 
     def start(
         self,
@@ -345,9 +443,26 @@ class MainRunner:
         - Creates a new group (ULID-based ID).
         - Stages sweeps and reps on disk.
         - If not dryrun, executes all reps sequentially. (Placeholder, later for SLURM.)
+
+        Registry events are buffered during the run; the registry is flushed and
+        closed before returning, including when an exception propagates.
         """
+        try:
+            return self._start(
+                config_path, reps_per_sweep=reps_per_sweep, group_id=group_id
+            )
+        finally:
+            self.registry.close()
+
+    def _start(
+        self,
+        config_path: Path | str,
+        *,
+        reps_per_sweep: int,
+        group_id: Optional[str],
+    ) -> str:
         # Load and validate config
-        cfg = load_config_from_yaml(config_path)
+        cfg = load_config_from_yaml(config_path, cache=self.cache_config)
         validate_config(cfg)
 
         #########################################################
@@ -368,41 +483,40 @@ class MainRunner:
             posted_group_running = False
 
             # Get all sweep subdirs in this group
-            for sweep_dir in sorted(
-                p
-                for p in group_dir.iterdir()
-                if p.is_dir() and p.name.startswith(SWEEP_PREFIX)
-            ):
+            for sweep_dir in _list_subdirs(group_dir, SWEEP_PREFIX):
                 # Get sweep manifest and parameter overrides
                 sweep_id = sweep_dir.name
                 sm_path = get_sweep_manifest_path(
                     group_id, group_dt, sweep_id, test=self.test
                 )
-                if not sm_path.exists():
+                try:
+                    sweep_manifest = SweepManifest.load(sm_path)
+                except FileNotFoundError:
                     # if a sweep manifest is missing (shouldn't normally happen), skip it
                     logger.warning(
                         f"Sweep manifest {sm_path} missing, skipping sweep {sweep_id}"
                     )
                     continue
-                sweep_manifest = SweepManifest.load(sm_path)
                 element_overrides = sweep_manifest.parameter_combination or {}
 
-                for rep_dir in sorted(
-                    p
-                    for p in sweep_dir.iterdir()
-                    if p.is_dir() and p.name.startswith(REP_PREFIX)
-                ):
+                # Final status of every rep with a manifest, for the sweep summary
+                rep_entries: list[dict[str, Any]] = []
+                for rep_dir in _list_subdirs(sweep_dir, REP_PREFIX):
                     rep_id = rep_dir.name
                     rm_path = get_rep_manifest_path(
                         group_id, group_dt, sweep_id, rep_id, test=self.test
                     )
-                    if not rm_path.exists():
+                    try:
+                        rep_manifest = RepManifest.load(rm_path)
+                    except FileNotFoundError:
                         logger.warning(
                             f"Rep manifest {rm_path} missing, skipping rep {rep_id}"
                         )
                         continue
-                    rep_manifest = RepManifest.load(rm_path)
-                    if is_terminal(rep_manifest.status):
+                    if rep_manifest.status in TERMINAL_STATUSES:
+                        rep_entries.append(
+                            {"rep_id": rep_id, "status": rep_manifest.status}
+                        )
                         logger.info(
                             f"Rep {rep_id} in sweep {sweep_id} is already complete."
                         )
@@ -416,25 +530,13 @@ class MainRunner:
                         subcfg = prepare_config_for_run(cfg, element_overrides)
 
                     if not posted_group_running:
-                        self.registry.append_event(
-                            {
-                                "type": "UPDATE_STATUS",
-                                "group_id": group_id,
-                                "timestamp": datetime.now().isoformat() + "Z",
-                                "status": "RUNNING",
-                            }
-                        )
-                        group_dt = _resolve_group_date_from_group_id(group_id)
-                        update_group_manifest(
-                            get_group_manifest_path(group_id, group_dt, test=self.test),
-                            {"status": "RUNNING"},
-                        )
+                        self._post_group_running(group_id, group_dt)
                         posted_group_running = True
 
                     # Run the rep
                     exp_path = str(cfg.get("experiment_path", ""))
                     exp_class = str(cfg.get("experiment_class", "Experiment"))
-                    run_single_rep(
+                    status = run_single_rep(
                         cfg=subcfg,
                         group_id=group_id,
                         sweep_id=sweep_id,
@@ -443,50 +545,15 @@ class MainRunner:
                         experiment_class=exp_class,
                         test=self.test,
                     )
+                    rep_entries.append({"rep_id": rep_id, "status": status})
 
                 # After attempting reps, summarize sweep status and log one element-level UPDATE_STATUS event
-                # (Reload each rep manifest to get final statuses)
-                rep_entries = []
-                for rep_dir in sorted(
-                    p
-                    for p in sweep_dir.iterdir()
-                    if p.is_dir() and p.name.startswith(REP_PREFIX)
-                ):
-                    rep_dirname = rep_dir.name
-                    rm_path = get_rep_manifest_path(
-                        group_id, group_dt, sweep_id, rep_dirname, test=self.test
-                    )
-                    if rm_path.exists():
-                        rep_manifest = RepManifest.load(rm_path)
-                        rep_entries.append(
-                            {
-                                "rep_id": rep_manifest.rep_id,
-                                "status": rep_manifest.status,
-                            }
-                        )
-                sweep_status = summarize_sweep_status(rep_entries)
-                update_sweep_manifest(sm_path, {"status": sweep_status})
-                self.registry.append_event(
-                    {
-                        "type": "UPDATE_STATUS",
-                        "group_id": group_id,
-                        "sweep_id": sweep_id,
-                        "timestamp": datetime.now().isoformat() + "Z",
-                        "status": sweep_status,
-                    }
-                )
+                self._finish_sweep(group_id, sweep_id, sm_path, rep_entries)
 
             # Summarize final group status
-            sweep_manifest_paths = sorted(
-                glob(
-                    str(
-                        get_group_dir(group_id, group_dt, test=self.test).joinpath(
-                            "S_*", MANIFEST_FILENAME
-                        )
-                    )
-                )
+            sweeps = _load_sweep_manifests(
+                get_group_dir(group_id, group_dt, test=self.test)
             )
-            sweeps = [SweepManifest.load(Path(path)) for path in sweep_manifest_paths]
             group_status = summarize_group_status(sweeps)
             update_group_manifest(
                 get_group_manifest_path(group_id, group_dt, test=self.test),
@@ -496,7 +563,7 @@ class MainRunner:
                 {
                     "type": "UPDATE_STATUS",
                     "group_id": group_id,
-                    "timestamp": datetime.now().isoformat() + "Z",
+                    "timestamp": utc_now_iso(),
                     "status": group_status,
                 }
             )
@@ -532,7 +599,8 @@ class MainRunner:
         if not sweep_elements:
             sweep_elements = [("S_0001", {})]  # single sweep, no params
 
-        # Stage sweeps and reps
+        # Stage sweeps in order (so SUBMIT_SWEEP events stay ordered), then reps
+        rep_tasks: list[dict[str, Any]] = []
         for sweep_id, overrides in sweep_elements:
             stage_sweep(
                 cfg=cfg,
@@ -544,15 +612,18 @@ class MainRunner:
                 registry=self.registry,
             )
             for r in range(reps_per_sweep):
-                rep_id = format_rep_id(r + 1)
-                stage_rep(
-                    base_cfg=cfg,
-                    group_id=group_id,
-                    sweep_id=sweep_id,
-                    rep_id=rep_id,
-                    sweep_overrides=overrides,
-                    test=self.test,
+                rep_tasks.append(
+                    {
+                        "base_cfg": cfg,
+                        "group_id": group_id,
+                        "sweep_id": sweep_id,
+                        "rep_id": format_rep_id(r + 1),
+                        "sweep_overrides": overrides,
+                        "test": self.test,
+                        "write_flat_config": self.write_flat_config,
+                    }
                 )
+        _stage_reps(rep_tasks)
 
         # If dryrun, stop here
         if self.dryrun:
@@ -564,88 +635,50 @@ class MainRunner:
         exp_path = str(cfg.get("experiment_path", ""))
         exp_class = str(cfg.get("experiment_class", "Experiment"))
 
-        posted_group_running = False
+        sweep_jobs: list[tuple[str, list[dict[str, Any]]]] = []
         for sweep_id, overrides in sweep_elements:
-            # mark sweep start
-            group_dt = _resolve_group_date_from_group_id(group_id)
-            sm_path = get_sweep_manifest_path(
-                group_id, group_dt, sweep_id, test=self.test
-            )
-            update_sweep_manifest(sm_path, {"status": "RUNNING"})
-            for r in range(reps_per_sweep):
-                rep_id = format_rep_id(r + 1)
-                # subconfig is the prepared config for this specific (sweep, rep) element
-                subconfig = prepare_config_for_run(cfg, overrides)
-
-                # Post a single group-level RUNNING event when the first rep starts
-                if not posted_group_running:
-                    self.registry.append_event(
-                        {
-                            "type": "UPDATE_STATUS",
-                            "group_id": group_id,
-                            "timestamp": datetime.now().isoformat() + "Z",
-                            "status": "RUNNING",
-                        }
-                    )
-                    group_dt = _resolve_group_date_from_group_id(group_id)
-                    update_group_manifest(
-                        get_group_manifest_path(group_id, group_dt, test=self.test),
-                        {"status": "RUNNING"},
-                    )
-                    posted_group_running = True
-
-                run_single_rep(
-                    cfg=subconfig,
-                    group_id=group_id,
-                    sweep_id=sweep_id,
-                    rep_id=rep_id,
-                    experiment_path=exp_path,
-                    experiment_class=exp_class,
-                    test=self.test,
-                )
-
-            sweep_manifest = SweepManifest.load(sm_path)
-            # Reload each rep manifest to summarize final sweep status
-            rep_entries = []
-            for r in range(reps_per_sweep):
-                rep_id = format_rep_id(r + 1)
-                rm_path = get_rep_manifest_path(
-                    group_id, group_dt, sweep_id, rep_id, test=self.test
-                )
-                rep_manifest = RepManifest.load(rm_path)
-                rep_entries.append(
-                    {
-                        "rep_id": rep_manifest.rep_id,
-                        "status": rep_manifest.status,
-                    }
-                )
-            sweep_status = summarize_sweep_status(rep_entries)
-            update_sweep_manifest(sm_path, {"status": sweep_status})
-
-            # Append a sweep-level status update to the registry
-            self.registry.append_event(
+            jobs = [
                 {
-                    "type": "UPDATE_STATUS",
+                    # prepared config for this specific (sweep, rep) element
+                    "cfg": prepare_config_for_run(cfg, overrides),
                     "group_id": group_id,
                     "sweep_id": sweep_id,
-                    "timestamp": datetime.now().isoformat() + "Z",
-                    "status": sweep_status,
+                    "rep_id": format_rep_id(r + 1),
+                    "experiment_path": exp_path,
+                    "experiment_class": exp_class,
+                    "test": self.test,
                 }
-            )
+                for r in range(reps_per_sweep)
+            ]
+            sweep_jobs.append((sweep_id, jobs))
+
+        num_jobs = sum(len(jobs) for _, jobs in sweep_jobs)
+        if self.max_workers > 1 and num_jobs > 1:
+            self._run_sweeps_in_pool(group_id, group_dt, sweep_jobs, num_jobs)
+        else:
+            posted_group_running = False
+            for sweep_id, jobs in sweep_jobs:
+                # mark sweep start
+                sm_path = get_sweep_manifest_path(
+                    group_id, group_dt, sweep_id, test=self.test
+                )
+                update_sweep_manifest(sm_path, {"status": "RUNNING"})
+                rep_entries = []
+                for job in jobs:
+                    # Post a single group-level RUNNING event when the first rep starts
+                    if not posted_group_running:
+                        self._post_group_running(group_id, group_dt)
+                        posted_group_running = True
+
+                    status = run_single_rep(**job)
+                    rep_entries.append({"rep_id": job["rep_id"], "status": status})
+                self._finish_sweep(group_id, sweep_id, sm_path, rep_entries)
 
         # Summarize final group status
         # Load all sweep manifests in this group
-        group_dt = _resolve_group_date_from_group_id(group_id)
-        sweep_manifest_paths = sorted(
-            glob(
-                str(
-                    get_group_dir(group_id, group_dt, test=self.test).joinpath(
-                        "S_*", MANIFEST_FILENAME
-                    )
-                )
-            )
+        sweeps = _load_sweep_manifests(
+            get_group_dir(group_id, group_dt, test=self.test)
         )
-        sweeps = [SweepManifest.load(Path(path)) for path in sweep_manifest_paths]
         group_status = summarize_group_status(sweeps)
         update_group_manifest(
             get_group_manifest_path(group_id, group_dt, test=self.test),
@@ -655,7 +688,7 @@ class MainRunner:
             {
                 "type": "UPDATE_STATUS",
                 "group_id": group_id,
-                "timestamp": datetime.now().isoformat() + "Z",
+                "timestamp": utc_now_iso(),
                 "status": group_status,
             }
         )
@@ -668,3 +701,89 @@ class MainRunner:
             logger.info(f"Finalized group manifest to status {gm.status} at {gm_path}")
 
         return group_id
+
+    def _post_group_running(self, group_id: str, group_dt: datetime) -> None:
+        self.registry.append_event(
+            {
+                "type": "UPDATE_STATUS",
+                "group_id": group_id,
+                "timestamp": utc_now_iso(),
+                "status": "RUNNING",
+            }
+        )
+        update_group_manifest(
+            get_group_manifest_path(group_id, group_dt, test=self.test),
+            {"status": "RUNNING"},
+        )
+
+    def _finish_sweep(
+        self,
+        group_id: str,
+        sweep_id: str,
+        sm_path: Path,
+        rep_entries: list[dict[str, Any]],
+    ) -> None:
+        """
+        Summarize the sweep from its rep statuses and record it in the sweep
+        manifest and the registry.
+        """
+        sweep_status = summarize_sweep_status(rep_entries)
+        update_sweep_manifest(sm_path, {"status": sweep_status})
+        self.registry.append_event(
+            {
+                "type": "UPDATE_STATUS",
+                "group_id": group_id,
+                "sweep_id": sweep_id,
+                "timestamp": utc_now_iso(),
+                "status": sweep_status,
+            }
+        )
+
+    def _run_sweeps_in_pool(
+        self,
+        group_id: str,
+        group_dt: datetime,
+        sweep_jobs: list[tuple[str, list[dict[str, Any]]]],
+        num_jobs: int,
+    ) -> None:
+        """
+        Run every rep of the group on a process pool. All sweeps are marked RUNNING
+        as their reps are queued; each is summarized, in order, once its reps finish.
+        Reps write their own manifests; registry events stay in this process.
+        """
+        self._post_group_running(group_id, group_dt)
+        with ProcessPoolExecutor(
+            max_workers=min(self.max_workers, num_jobs),
+            initializer=_init_rep_worker,
+            initargs=(current_log_file(), get_logger().getEffectiveLevel()),
+        ) as pool:
+            submitted = []
+            for sweep_id, jobs in sweep_jobs:
+                sm_path = get_sweep_manifest_path(
+                    group_id, group_dt, sweep_id, test=self.test
+                )
+                update_sweep_manifest(sm_path, {"status": "RUNNING"})
+                futures = [(job, pool.submit(_run_rep_job, job)) for job in jobs]
+                submitted.append((sweep_id, sm_path, futures))
+
+            for sweep_id, sm_path, futures in submitted:
+                rep_entries = []
+                for job, future in futures:
+                    try:
+                        status = future.result()
+                    except Exception as e:
+                        # The worker died (or the job failed to pickle) before
+                        # run_single_rep could record the outcome itself
+                        rep_id = job["rep_id"]
+                        logger.exception(
+                            f"Worker for rep {rep_id} in sweep {sweep_id} failed: {e}"
+                        )
+                        status = "CRASHED"
+                        update_rep_manifest(
+                            get_rep_manifest_path(
+                                group_id, group_dt, sweep_id, rep_id, test=self.test
+                            ),
+                            {"status": status, "timestamp_end": utc_now_iso()},
+                        )
+                    rep_entries.append({"rep_id": job["rep_id"], "status": status})
+                self._finish_sweep(group_id, sweep_id, sm_path, rep_entries)
@@ -1,8 +1,10 @@
+import re
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Tuple
 
-from rem.constants import GROUP_PREFIX, REP_PAD, REP_PREFIX, SWEEP_PAD, SWEEP_PREFIX
+from rem.constants import GROUP_PREFIX, REP_FMT, REP_PREFIX, SWEEP_FMT, SWEEP_PREFIX
 from rem.utils.ulid import new_ulid, timestamp_from_ulid
 
 
@@ -12,61 +14,69 @@ def create_group_stamp() -> Tuple[str, str]:
     """
     ulid_str = new_ulid()  # 26-char ULID
     timestamp = timestamp_from_ulid(ulid_str)
-    group_date = timestamp.strftime("%Y%m%d")
+    group_date = f"{timestamp.year:04d}{timestamp.month:02d}{timestamp.day:02d}"
     group_id = f"{GROUP_PREFIX}{ulid_str[:10]}_{ulid_str[10:]}"
     return group_id, group_date
 
 
 def format_sweep_id(index: int) -> str:
-    return f"{SWEEP_PREFIX}{index:0{SWEEP_PAD}d}"
+    return SWEEP_FMT.format(index)
 
 
 def format_rep_id(index: int) -> str:
-    return f"{REP_PREFIX}{index:0{REP_PAD}d}"
+    return REP_FMT.format(index)
 
 
+_GP_LEN = len(GROUP_PREFIX)
+_SP_LEN = len(SWEEP_PREFIX)
+_RP_LEN = len(REP_PREFIX)
+# Group IDs are GROUP_PREFIX + 10 ULID timestamp chars + "_" + 16 random chars
+_GROUP_SEP_POS = _GP_LEN + 10
+_GROUP_ID_RE = re.compile(re.escape(GROUP_PREFIX) + r"[^_]{10}_[^_]{16}")
+# ASCII digits only, as written by format_sweep_id/format_rep_id (str.isdigit
+# would also accept e.g. superscripts, which int() then rejects)
+_SWEEP_ID_RE = re.compile(re.escape(SWEEP_PREFIX) + r"[0-9]+")
+_REP_ID_RE = re.compile(re.escape(REP_PREFIX) + r"[0-9]+")
+
+
+@lru_cache(maxsize=256)
 def parse_group_id(group_id: str) -> str:
     if not group_id.startswith(GROUP_PREFIX):
         raise ValueError(f"Invalid group ID: {group_id}")
-    raw = group_id[len(GROUP_PREFIX) :]
-    parts = raw.split("_")
-    if len(parts) != 2 or len(parts[0]) != 10 or len(parts[1]) != 16:
+    if _GROUP_ID_RE.fullmatch(group_id) is None:
         raise ValueError(f"Malformed group ID: {group_id}")
-    return parts[0] + parts[1]  # Reconstruct canonical ULID
+    # Reconstruct canonical ULID
+    return group_id[_GP_LEN:_GROUP_SEP_POS] + group_id[_GROUP_SEP_POS + 1 :]
 
 
 def parse_sweep_id(sweep_id: str) -> int:
     if not sweep_id.startswith(SWEEP_PREFIX):
         raise ValueError(f"Invalid sweep ID: {sweep_id}")
-    return int(sweep_id[len(SWEEP_PREFIX) :])
+    return int(sweep_id[_SP_LEN:])
 
 
 def parse_rep_id(rep_id: str) -> int:
     if not rep_id.startswith(REP_PREFIX):
         raise ValueError(f"Invalid rep ID: {rep_id}")
-    return int(rep_id[len(REP_PREFIX) :])
+    return int(rep_id[_RP_LEN:])
 
 
 def next_rep_id(rep_ids: list[str]) -> str:
     """
     Given a list of R_xxxx IDs, return the next unused rep ID.
     """
-    indices = [parse_rep_id(rid) for rid in rep_ids if rid.startswith(REP_PREFIX)]
+    indices = [int(rid[_RP_LEN:]) for rid in rep_ids if rid.startswith(REP_PREFIX)]
     next_index = max(indices, default=-1) + 1
     return format_rep_id(next_index)
 
 
 def is_valid_group_id(group_id: str) -> bool:
-    if not group_id.startswith(GROUP_PREFIX):
-        return False
-    raw = group_id[len(GROUP_PREFIX) :]
-    parts = raw.split("_")
-    return len(parts) == 2 and len(parts[0]) == 10 and len(parts[1]) == 16
+    return _GROUP_ID_RE.fullmatch(group_id) is not None
 
 
 def is_valid_sweep_id(sweep_id: str) -> bool:
-    return sweep_id.startswith(SWEEP_PREFIX) and sweep_id[len(SWEEP_PREFIX) :].isdigit()
+    return _SWEEP_ID_RE.fullmatch(sweep_id) is not None
 
 
 def is_valid_rep_id(rep_id: str) -> bool:
-    return rep_id.startswith(REP_PREFIX) and rep_id[len(REP_PREFIX) :].isdigit()
+    return _REP_ID_RE.fullmatch(rep_id) is not None
@@ -1,23 +1,27 @@
-VALID_STATUSES: set[str] = {
-    "PENDING",
-    "PARTIAL_COMPLETION",
-    "RUNNING",
-    "COMPLETED",
-    "FAILED",
-    "KILLED",
-    "TIMEOUT",
-    "CRASHED",
-    "SKIPPED",
-}
+VALID_STATUSES: frozenset[str] = frozenset(
+    {
+        "PENDING",
+        "PARTIAL_COMPLETION",
+        "RUNNING",
+        "COMPLETED",
+        "FAILED",
+        "KILLED",
+        "TIMEOUT",
+        "CRASHED",
+        "SKIPPED",
+    }
+)
 
-TERMINAL_STATUSES: set[str] = {
-    "COMPLETED",
-    "FAILED",
-    "KILLED",
-    "TIMEOUT",
-    "CRASHED",
-    "SKIPPED",
-}
+TERMINAL_STATUSES: frozenset[str] = frozenset(
+    {
+        "COMPLETED",
+        "FAILED",
+        "KILLED",
+        "TIMEOUT",
+        "CRASHED",
+        "SKIPPED",
+    }
+)
 
 
 def is_terminal(status: str) -> bool:
@@ -1,7 +1,10 @@
 import itertools
+from collections.abc import Iterable
 from typing import Any
 
-from rem.constants import SWEEP_PAD, SWEEP_PREFIX
+from rem.constants import SWEEP_FMT
+
+_format_sweep_id = SWEEP_FMT.format
 
 
 def merge_dicts(*dicts: dict[str, Any]) -> dict[str, Any]:
@@ -18,6 +21,50 @@ def merge_dicts(*dicts: dict[str, Any]) -> dict[str, Any]:
     return out
 
 
+def _check_disjoint_keys(expanded_subs: list[list[dict[str, Any]]]) -> None:
+    """
+    Raise ValueError if two grid sub-nodes can produce the same key. Checked once on
+    the key union of each sub-node rather than for every combination, reporting
+    the first duplicate in key order, as merging the combinations would.
+    """
+    if not all(expanded_subs):
+        return  # no combinations, so nothing is ever merged
+    seen: set[str] = set()
+    for sub in expanded_subs:
+        keys = dict.fromkeys(k for d in sub for k in d)
+        for k in keys:
+            if k in seen:
+                raise ValueError(f"Duplicate key '{k}' in sweep merge")
+        seen.update(keys)
+
+
+def _merge_disjoint(dicts: tuple[dict[str, Any], ...]) -> dict[str, Any]:
+    out: dict[str, Any] = {}
+    for d in dicts:
+        out.update(d)
+    return out
+
+
+def _rows_to_dicts(
+    keys: list[str], rows: Iterable[tuple[Any, ...]]
+) -> list[dict[str, Any]]:
+    """
+    Build one dict per row of values. Sweeps rarely vary more than a few keys
+    together, so those widths use dict displays, which skip the per-row zip.
+    """
+    n = len(keys)
+    if n == 1:
+        (k0,) = keys
+        return [{k0: a} for (a,) in rows]
+    if n == 2:
+        k0, k1 = keys
+        return [{k0: a, k1: b} for a, b in rows]
+    if n == 3:
+        k0, k1, k2 = keys
+        return [{k0: a, k1: b, k2: c} for a, b, c in rows]
+    return [dict(zip(keys, row)) for row in rows]
+
+
 def expand_sweep_node(node: Any) -> list[dict[str, Any]]:
     """
     Recursively expands a sweep node into a list of parameter combinations.
@@ -29,7 +76,10 @@ def expand_sweep_node(node: Any) -> list[dict[str, Any]]:
             if not isinstance(sub_nodes, list):
                 raise ValueError("'grid' must map to a list of sub-nodes")
             expanded_subs = [expand_sweep_node(n) for n in sub_nodes]
-            return [merge_dicts(*combo) for combo in itertools.product(*expanded_subs)]
+            _check_disjoint_keys(expanded_subs)
+            return [
+                _merge_disjoint(combo) for combo in itertools.product(*expanded_subs)
+            ]
 
         elif "zip" in node:
             zip_block = node["zip"]
@@ -39,14 +89,18 @@ def expand_sweep_node(node: Any) -> list[dict[str, Any]]:
             keys = list(zip_block.keys())
             values = list(zip_block.values())
 
-            if not values or not all(isinstance(v, list) for v in values):
+            if not values:
                 raise ValueError("All zip values must be lists")
+            length = -1
+            for v in values:
+                if not isinstance(v, list):
+                    raise ValueError("All zip values must be lists")
+                if length < 0:
+                    length = len(v)
+                elif len(v) != length:
+                    raise ValueError("All zip lists must be the same length")
 
-            length = len(values[0])
-            if not all(len(v) == length for v in values):
-                raise ValueError("All zip lists must be the same length")
-
-            return [dict(zip(keys, zipped_vals)) for zipped_vals in zip(*values)]
+            return _rows_to_dicts(keys, zip(*values))
 
         else:
             # Flat grid leaf
@@ -54,20 +108,20 @@ def expand_sweep_node(node: Any) -> list[dict[str, Any]]:
             values = list(node.values())
             if not all(isinstance(v, list) for v in values):
                 raise ValueError("All values in flat grid leaf must be lists")
-            return [dict(zip(keys, combo)) for combo in itertools.product(*values)]
+            return _rows_to_dicts(keys, itertools.product(*values))
 
     raise ValueError(f"Invalid sweep node: {node}")
 
 
 def generate_sweep_element_ids(n: int) -> list[str]:
-    return [f"{SWEEP_PREFIX}{i+1:0{SWEEP_PAD}d}" for i in range(n)]
+    return list(map(_format_sweep_id, range(1, n + 1)))
 
 
 def get_sweep_elements(cfg: dict[str, Any]) -> list[tuple[str, dict[str, Any]]]:
     if "sweep" not in cfg:
-        return [(f"{SWEEP_PREFIX}{1:0{SWEEP_PAD}d}", {})]
+        return [(SWEEP_FMT.format(1), {})]
 
     sweep_root = cfg["sweep"]
     sweep_space = expand_sweep_node(sweep_root)
-    sweep_ids = generate_sweep_element_ids(len(sweep_space))
-    return list(zip(sweep_ids, sweep_space))
+    # Single pass; same IDs as generate_sweep_element_ids(len(sweep_space))
+    return list(zip(map(_format_sweep_id, itertools.count(1)), sweep_space))
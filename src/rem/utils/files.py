@@ -0,0 +1,26 @@
+import os
+from pathlib import Path
+from typing import Iterable
+
+# O_BINARY only exists on Windows, where it disables newline translation
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def write_files(items: Iterable[tuple[Path, bytes]]) -> None:
+    """
+    Write a batch of small files, replacing any existing contents.
+
+    Each file is written with raw os.open/os.write calls, skipping the buffered
+    and text layers of open() since the whole payload is already in memory.
+
+    Args:
+        items (Iterable[tuple[Path, bytes]]): (path, data) pairs to write.
+    """
+    for path, data in items:
+        fd = os.open(path, _WRITE_FLAGS, 0o666)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
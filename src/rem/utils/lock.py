@@ -1,49 +1,148 @@
 from __future__ import annotations
 
-import json
 import os
 import socket
+import threading
 import time
+import weakref
 from dataclasses import dataclass
 from pathlib import Path
 from types import TracebackType
 from typing import Optional
 
 from rem.utils.logger import get_logger
+from rem.utils.serialization import dumps, loads
 
 logger = get_logger(__name__)
 
+# fdatasync skips the metadata flush; it doesn't exist on Windows or macOS
+_fdatasync = getattr(os, "fdatasync", os.fsync)
+
+# First retry delay when waiting on a held lock
+_MIN_POLL = 0.001
+
+# Identity of this process, looked up once; the PID is refreshed in forked children
+_HOSTNAME = socket.gethostname()
+_HOSTNAME_JSON = dumps(_HOSTNAME)
+_PID = os.getpid()
+
+
+def _pid_namespace() -> str:
+    """
+    Identify the PID namespace of this process: the kernel boot ID plus the
+    namespace inode. Containers commonly share a hostname and a results
+    directory but not PIDs, so a holder's PID is only probed when this matches.
+    Empty where /proc doesn't expose it (e.g. macOS).
+    """
+    try:
+        boot_id = Path("/proc/sys/kernel/random/boot_id").read_text().strip()
+        return f"{boot_id}/{os.readlink('/proc/self/ns/pid')}"
+    except OSError:
+        return ""
+
+
+_PID_NAMESPACE = _pid_namespace()
+_PID_NAMESPACE_JSON = dumps(_PID_NAMESPACE)
+
+
+# One in-process lock per lock file, keyed by absolute path. Threads of this
+# process queue on it instead of polling, so only one of them at a time touches
+# the lock file; other processes are still excluded by the lock file alone.
+_local_locks: weakref.WeakValueDictionary[str, threading.Lock] = (
+    weakref.WeakValueDictionary()
+)
+_local_locks_guard = threading.Lock()
+
+
+def _local_lock(key: str) -> threading.Lock:
+    with _local_locks_guard:
+        lock = _local_locks.get(key)
+        if lock is None:
+            lock = _local_locks[key] = threading.Lock()
+        return lock
+
+
+def _reinit_after_fork() -> None:
+    global _PID, _local_locks, _local_locks_guard
+    _PID = os.getpid()
+    # Locks held by other threads at the time of the fork would never be released
+    _local_locks = weakref.WeakValueDictionary()
+    _local_locks_guard = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):  # not available on Windows
+    os.register_at_fork(after_in_child=_reinit_after_fork)
+
 
 @dataclass
 class LockInfo:
     pid: int
     hostname: str
     timestamp: float
+    # PID namespace of the holder (see _pid_namespace); empty if unknown
+    namespace: str = ""
 
-    def to_json(self) -> str:
-        return json.dumps(
-            {
-                "pid": self.pid,
-                "hostname": self.hostname,
-                "timestamp": self.timestamp,
-            }
+    def to_bytes(self) -> bytes:
+        # Fixed schema, so format directly; only the strings need JSON escaping,
+        # and this process's values are escaped once at import
+        hostname = (
+            _HOSTNAME_JSON if self.hostname == _HOSTNAME else dumps(self.hostname)
+        )
+        namespace = (
+            _PID_NAMESPACE_JSON
+            if self.namespace == _PID_NAMESPACE
+            else dumps(self.namespace)
+        )
+        return b'{"pid":%d,"hostname":%s,"timestamp":%r,"namespace":%s}' % (
+            self.pid,
+            hostname,
+            self.timestamp,
+            namespace,
         )
 
+    def to_json(self) -> str:
+        return self.to_bytes().decode("utf-8")
+
     @staticmethod
     def from_json(path: Path) -> Optional[LockInfo]:
         try:
-            with path.open("r") as f:
-                data = json.load(f)
+            data = loads(path.read_bytes())
             return LockInfo(
                 pid=int(data["pid"]),
                 hostname=str(data["hostname"]),
                 timestamp=float(data["timestamp"]),
+                # Absent from lock files written by older versions
+                namespace=str(data.get("namespace", "")),
             )
         except Exception as e:
-            logger.error(f"Failed to read lock file {path}: {e}")
+            logger.error("Failed to read lock file %s: %s", path, e)
             return None
 
 
+def _holder_is_dead(info: LockInfo) -> bool:
+    """
+    True if the lock holder is a process in this PID namespace that no longer
+    exists. Only probed on POSIX: on Windows os.kill(pid, 0) sends CTRL_C_EVENT.
+    An unknown (empty) namespace is never probed, so where /proc doesn't expose
+    it, dead holders are only broken once stale_after expires.
+    """
+    if (
+        os.name != "posix"
+        or info.pid <= 0
+        or info.hostname != _HOSTNAME
+        or not info.namespace
+        or info.namespace != _PID_NAMESPACE
+    ):
+        return False
+    try:
+        os.kill(info.pid, 0)
+    except ProcessLookupError:
+        return True
+    except OSError:
+        return False  # e.g. EPERM: the process exists but belongs to someone else
+    return False
+
+
 class FileLock:
     """
     Cross-platform file lock using atomic creation and unlinking of a lock file.
@@ -51,6 +150,14 @@ class FileLock:
     Acquire the lock using atomic creation (O_CREAT | O_EXCL). If exists, lock is held by another process.
     Hold the lock by keeping the file descriptor open, write LockInfo for traceability.
     Release the lock by closing the file descriptor and unlinking the lock file.
+    With nfs_safe, a private file is hard-linked to the lock path instead of O_EXCL.
+    Threads of the same process first queue on a shared in-process lock, so they
+    are handed the lock without polling the lock file. The wait on it is bounded
+    by stale_after, after which the waiter polls the lock file as before.
+
+    The lock is not re-entrant: a second acquire from the thread that holds it
+    waits for stale_after (or its timeout) and then breaks the lock, and with
+    stale_after=None and no timeout it blocks forever.
     """
 
     def __init__(
@@ -58,10 +165,29 @@ class FileLock:
         target_path: Path,
         suffix: str = ".lock",
         stale_after: Optional[float] = 10.0,
+        durable: bool = False,
+        nfs_safe: bool = False,
     ) -> None:
+        """
+        Args:
+            target_path (Path): Path of the resource to lock.
+            suffix (str): Suffix appended to target_path to form the lock file.
+            stale_after (float): Age in seconds after which a held lock is broken.
+            durable (bool): Sync the lock file's contents to disk on acquire.
+                Mutual exclusion comes from O_CREAT | O_EXCL alone, and the
+                contents are only for traceability, so this is off by default.
+            nfs_safe (bool): Acquire by hard-linking a private file into place,
+                which stays atomic on NFS where O_CREAT | O_EXCL may not.
+        """
         self.lock_path = Path(str(target_path) + suffix)
+        self._local_key = os.path.abspath(self.lock_path)
+        self._local: Optional[threading.Lock] = None
         self._fd: Optional[int] = None
         self._stale_after = stale_after
+        self._durable = durable
+        self._nfs_safe = nfs_safe
+        # (st_ino, st_mtime_ns, st_size) of the last lock file parsed while polling
+        self._seen_info: Optional[tuple[tuple[int, int, int], LockInfo]] = None
 
     def acquire(
         self,
@@ -69,50 +195,179 @@ class FileLock:
         timeout: Optional[float] = None,
         poll_interval: float = 0.05,
     ) -> None:
-        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
         start = time.monotonic()
+        local = self._acquire_local(blocking, timeout, start)
+        try:
+            self._acquire_file(blocking, timeout, poll_interval, start)
+        except BaseException:
+            if local is not None:
+                local.release()
+            raise
+        self._local = local
 
-        while True:
-            try:
-                # Atomic creation of the lock file
-                self._fd = os.open(
-                    self.lock_path, os.O_CREAT | os.O_EXCL | os.O_RDWR, 0o644
+    def _acquire_local(
+        self, blocking: bool, timeout: Optional[float], start: float
+    ) -> Optional[threading.Lock]:
+        """
+        Queue on the in-process lock. Returns None if it was held for longer than
+        stale_after, leaving the caller to poll (and eventually break) the lock
+        file just as another process would.
+        """
+        local = _local_lock(self._local_key)
+        if not blocking:
+            if not local.acquire(blocking=False):
+                raise self._busy()
+        else:
+            remaining = None
+            if timeout is not None:
+                remaining = max(timeout - (time.monotonic() - start), 0.0)
+            waits = [t for t in (remaining, self._stale_after) if t is not None]
+            if not local.acquire(timeout=min(waits) if waits else -1):
+                if remaining is not None and (
+                    self._stale_after is None or remaining <= self._stale_after
+                ):
+                    raise self._timed_out()
+                logger.warning(
+                    "In-process lock on %s held for over %ss; polling the lock file.",
+                    self.lock_path,
+                    self._stale_after,
                 )
-                info = LockInfo(
-                    pid=os.getpid(),
-                    hostname=socket.gethostname(),
-                    timestamp=time.time(),
-                )
-                os.write(self._fd, info.to_json().encode("utf-8"))
-                os.fsync(self._fd)
+                return None
+        return local
+
+    def _acquire_file(
+        self,
+        blocking: bool,
+        timeout: Optional[float],
+        poll_interval: float,
+        start: float,
+    ) -> None:
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Back off exponentially from _MIN_POLL up to poll_interval, so short
+        # holds are picked up quickly and long ones don't cause constant wakeups
+        delay = _MIN_POLL
+        while True:
+            info = LockInfo(
+                pid=_PID,
+                hostname=_HOSTNAME,
+                timestamp=time.time(),
+                namespace=_PID_NAMESPACE,
+            )
+            if self._nfs_safe:
+                acquired = self._create_via_link(info)
+            else:
+                acquired = self._create_exclusive(info)
+            if acquired:
                 logger.debug(
-                    f"Acquired lock: {self.lock_path} by PID {info.pid} on {info.hostname}"
+                    "Acquired lock: %s by PID %d on %s",
+                    self.lock_path,
+                    info.pid,
+                    info.hostname,
                 )
                 return
+            if not blocking:
+                raise self._busy()
+            if timeout is not None and (time.monotonic() - start) >= timeout:
+                raise self._timed_out()
+
+            if self._stale_after is not None:
+                existing_info = self._read_existing_info()
+                if existing_info is not None and (
+                    (time.time() - existing_info.timestamp) > self._stale_after
+                    or _holder_is_dead(existing_info)
+                ):
+                    logger.warning(
+                        "Stale lock detected at %s, removing.", self.lock_path
+                    )
+                    try:
+                        self._break_stale_lock(existing_info)
+                    except Exception:
+                        pass  # Ignore errors, will retry acquiring the lock
+            sleep_for = min(delay, poll_interval)
+            if timeout is not None:
+                remaining = timeout - (time.monotonic() - start)
+                sleep_for = max(min(sleep_for, remaining), 0.0)
+            time.sleep(sleep_for)
+            delay *= 2
+
+    def _busy(self) -> BlockingIOError:
+        logger.warning(
+            "Lock busy (non-blocking): %s is held by another process.",
+            self.lock_path,
+        )
+        return BlockingIOError(f"Lock busy: {self.lock_path}")
+
+    def _timed_out(self) -> TimeoutError:
+        msg = f"Timeout while waiting for lock on {self.lock_path}."
+        logger.error(msg)
+        return TimeoutError(msg)
+
+    def _create_exclusive(self, info: LockInfo) -> bool:
+        # Atomic creation of the lock file
+        try:
+            fd = os.open(self.lock_path, os.O_CREAT | os.O_EXCL | os.O_RDWR, 0o644)
+        except FileExistsError:
+            return False
+        self._fd = fd
+        os.write(fd, info.to_bytes())
+        if self._durable:
+            _fdatasync(fd)
+        return True
+
+    def _create_via_link(self, info: LockInfo) -> bool:
+        """
+        Write the lock contents to a private file and hard-link it into place.
+        link() is atomic even on NFS servers where O_EXCL is not; a link that
+        succeeded but reported EEXIST (a retransmitted request) is recognised by
+        the private file's link count.
+        """
+        tmp_path = f"{self.lock_path}.{_HOSTNAME}.{_PID}.{id(self)}.tmp"
+        fd = os.open(tmp_path, os.O_CREAT | os.O_TRUNC | os.O_RDWR, 0o644)
+        linked = False
+        try:
+            os.write(fd, info.to_bytes())
+            if self._durable:
+                _fdatasync(fd)
+            try:
+                os.link(tmp_path, self.lock_path)
+                linked = True
             except FileExistsError:
-                if not blocking:
-                    msg = f"Lock busy (non-blocking): {self.lock_path} is held by another process."
-                    logger.warning(msg)
-                    raise BlockingIOError(f"Lock busy: {self.lock_path}")
-                if timeout is not None and (time.monotonic() - start) >= timeout:
-                    msg = f"Timeout while waiting for lock on {self.lock_path}."
-                    logger.error(msg)
-                    raise TimeoutError(msg)
-
-                if self._stale_after is not None:
-                    existing_info = LockInfo.from_json(self.lock_path)
-                    if (
-                        existing_info is not None
-                        and (time.time() - existing_info.timestamp) > self._stale_after
-                    ):
-                        logger.warning(
-                            f"Stale lock detected at {self.lock_path}, removing."
-                        )
-                        try:
-                            self._break_stale_lock(existing_info)
-                        except Exception:
-                            pass  # Ignore errors, will retry acquiring the lock
-                time.sleep(poll_interval)
+                linked = os.fstat(fd).st_nlink == 2
+            except OSError:
+                # Filesystem without hard links: fall back to O_EXCL from now on
+                self._nfs_safe = False
+        finally:
+            # Closed before unlinking: Windows can't remove a file that is open
+            os.close(fd)
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+        if not linked and not self._nfs_safe:
+            return self._create_exclusive(info)
+        return linked
+
+    def _read_existing_info(self) -> Optional[LockInfo]:
+        """
+        Parse the current holder's LockInfo, reusing the last result while the
+        lock file is unchanged so each poll costs a stat rather than a parse.
+        """
+        try:
+            st = os.stat(self.lock_path)
+        except FileNotFoundError:
+            return None
+        if st.st_size == 0:
+            # Holder created the file but hasn't written to it yet (or died in
+            # between); age it by mtime so a crashed holder can still go stale
+            return LockInfo(pid=-1, hostname="", timestamp=st.st_mtime)
+        key = (st.st_ino, st.st_mtime_ns, st.st_size)
+        if self._seen_info is not None and self._seen_info[0] == key:
+            return self._seen_info[1]
+        info = LockInfo.from_json(self.lock_path)
+        if info is not None:
+            self._seen_info = (key, info)
+        return info
 
     def _break_stale_lock(self, info: LockInfo) -> None:
         try:
@@ -125,7 +380,7 @@ class FileLock:
             try:
                 os.close(self._fd)
             except Exception as e:
-                logger.error(f"Error closing lock file descriptor: {e}")
+                logger.error("Error closing lock file descriptor: %s", e)
             finally:
                 self._fd = None
         try:
@@ -133,7 +388,10 @@ class FileLock:
         except FileNotFoundError:
             pass
         except Exception as e:
-            logger.error(f"Error removing lock file {self.lock_path}: {e}")
+            logger.error("Error removing lock file %s: %s", self.lock_path, e)
+        if self._local is not None:
+            self._local.release()
+            self._local = None
 
     def __enter__(self) -> FileLock:
         self.acquire()
@@ -1,9 +1,23 @@
+import atexit
 import logging
+import os
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Optional, Union
+from typing import Final, Optional, Union, cast
 
 _LOGGER = None
+# Background thread writing queued records to the log file, if one is configured
+_LISTENER: Optional[QueueListener] = None
+
+_LEVELS: Final = {
+    "CRITICAL": logging.CRITICAL,
+    "ERROR": logging.ERROR,
+    "WARNING": logging.WARNING,
+    "INFO": logging.INFO,
+    "DEBUG": logging.DEBUG,
+}
 
 
 def get_logger(
@@ -19,7 +33,7 @@ def get_logger(
         log_file (Path): Optional path to a log file. If provided, logs will be written to this file.
         level (int): Logging level (default is logging.INFO).
     """
-    global _LOGGER
+    global _LOGGER, _LISTENER
 
     if _LOGGER is None:
         base = logging.getLogger("rem")
@@ -31,10 +45,17 @@ def get_logger(
             base.addHandler(console_handler)
 
             if log_file:
+                # File writes happen on a listener thread; callers only enqueue
+                stop_file_logging()
                 log_file.parent.mkdir(parents=True, exist_ok=True)
-                file_handler = logging.FileHandler(log_file)
+                records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+                file_handler = _DrainFlushFileHandler(log_file, records)
                 file_handler.setFormatter(_get_file_formatter())
-                base.addHandler(file_handler)
+                base.addHandler(QueueHandler(records))
+                _LISTENER = QueueListener(
+                    records, file_handler, respect_handler_level=True
+                )
+                _LISTENER.start()
         _LOGGER = base
     else:
         if level is not None:
@@ -43,17 +64,101 @@ def get_logger(
     return _LOGGER
 
 
+class _DrainFlushFileHandler(logging.FileHandler):
+    """
+    File handler for the queue listener that flushes only once the queue is empty,
+    so a burst of records is written out together rather than one flush each.
+    """
+
+    def __init__(
+        self, filename: Path, records: queue.SimpleQueue[logging.LogRecord]
+    ) -> None:
+        super().__init__(filename)
+        self._records = records
+
+    def flush(self) -> None:
+        if self._records.empty():
+            super().flush()
+
+
+def stop_file_logging() -> None:
+    """
+    Write out any queued records, close the log file and detach it from the logger.
+    """
+    global _LISTENER
+    if _LISTENER is None:
+        return
+    listener, _LISTENER = _LISTENER, None
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+    base = logging.getLogger("rem")
+    for handler in list(base.handlers):
+        if isinstance(handler, QueueHandler) and handler.queue is listener.queue:
+            base.removeHandler(handler)
+
+
+atexit.register(stop_file_logging)
+
+# Handlers inherited from the parent across a fork. Kept referenced: closing them
+# (or letting them be collected) would flush the parent's buffered records twice.
+_INHERITED_HANDLERS: list[logging.Handler] = []
+
+
+def current_log_file() -> Optional[Path]:
+    """
+    Return the file this process writes its log records to, if any.
+    """
+    if _LISTENER is not None:
+        return Path(cast(logging.FileHandler, _LISTENER.handlers[0]).baseFilename)
+    for handler in logging.getLogger("rem").handlers:
+        if isinstance(handler, logging.FileHandler):
+            return Path(handler.baseFilename)
+    return None
+
+
+def log_to_file(log_file: Path) -> None:
+    """
+    Write records straight to `log_file` from this process, without a listener
+    thread. Meant for worker processes (e.g. a process pool initializer) that log
+    to the same file as their parent; does nothing if already attached.
+    """
+    base = logging.getLogger("rem")
+    target = os.path.abspath(log_file)
+    for handler in base.handlers:
+        if isinstance(handler, logging.FileHandler) and handler.baseFilename == target:
+            return
+    # Each record is a single append, so lines from several processes don't tear
+    file_handler = logging.FileHandler(log_file)
+    file_handler.setFormatter(_get_file_formatter())
+    base.addHandler(file_handler)
+
+
+def _reinit_file_logging_after_fork() -> None:
+    """
+    The listener thread doesn't survive a fork, so records queued in the child
+    would never be written. Swap the queue for a plain handler on the same file.
+    """
+    global _LISTENER
+    listener, _LISTENER = _LISTENER, None
+    if listener is None:
+        return
+    base = logging.getLogger("rem")
+    for handler in list(base.handlers):
+        if isinstance(handler, QueueHandler) and handler.queue is listener.queue:
+            base.removeHandler(handler)
+    _INHERITED_HANDLERS.extend(listener.handlers)
+    log_to_file(Path(cast(logging.FileHandler, listener.handlers[0]).baseFilename))
+
+
+if hasattr(os, "register_at_fork"):  # not available on Windows
+    os.register_at_fork(after_in_child=_reinit_file_logging_after_fork)
+
+
 def _resolve_level(level: Union[str, int]) -> int:
     if isinstance(level, int):
         return level
-    level_str = str(level).upper()
-    return {
-        "CRITICAL": logging.CRITICAL,
-        "ERROR": logging.ERROR,
-        "WARNING": logging.WARNING,
-        "INFO": logging.INFO,
-        "DEBUG": logging.DEBUG,
-    }.get(level_str, logging.INFO)
+    return _LEVELS.get(str(level).upper(), logging.INFO)
 
 
 def _get_console_formatter() -> logging.Formatter:
@@ -1,5 +1,6 @@
 import os
 from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Union
 
@@ -14,7 +15,7 @@ def get_rem_root() -> Path:
     and defaults to the current working directory otherwise.
 
     """
-    return Path(os.environ.get("REM_ROOT", Path.cwd()))
+    return Path(_root_key())
 
 
 # Global paths
@@ -23,9 +24,13 @@ def get_results_dir(test: bool = False) -> Path:
     Return the default results directory.
 
     """
+    return _results_dir(get_rem_root(), test)
+
+
+def _results_dir(root: Path, test: bool) -> Path:
     if test:
-        return get_rem_root().joinpath("results", "test")
-    return get_rem_root().joinpath("results")
+        return root.joinpath("results", "test")
+    return root.joinpath("results")
 
 
 def get_default_events_path(test: bool = False) -> Path:
@@ -36,23 +41,77 @@ def get_default_events_path(test: bool = False) -> Path:
     return get_results_dir(test=test).joinpath(EVENTS_FILENAME)
 
 
+# Group/sweep/rep paths are memoized on plain, cheaply hashed keys. The root is
+# looked up on every call (REM_ROOT may change between runs), never cached.
+_DateKey = tuple[int, int, int]
+
+
+def _root_key() -> str:
+    root = os.environ.get("REM_ROOT")
+    return os.getcwd() if root is None else root
+
+
+def _date_key(group_date: Union[date, datetime]) -> _DateKey:
+    return (group_date.year, group_date.month, group_date.day)
+
+
+@lru_cache(maxsize=4096)
+def _group_dir(root: str, test: bool, group_id: str, ymd: _DateKey) -> Path:
+    year, month, day = ymd
+    # One constructor call rather than building the results dir first
+    parts = (str(year), f"{month:02d}", f"{day:02d}", group_id)
+    if test:
+        return Path(root, "results", "test", *parts)
+    return Path(root, "results", *parts)
+
+
+@lru_cache(maxsize=4096)
+def _sweep_dir(
+    root: str, test: bool, group_id: str, ymd: _DateKey, sweep_id: str
+) -> Path:
+    return _group_dir(root, test, group_id, ymd).joinpath(sweep_id)
+
+
+@lru_cache(maxsize=4096)
+def _rep_dir(
+    root: str, test: bool, group_id: str, ymd: _DateKey, sweep_id: str, rep_id: str
+) -> Path:
+    return _sweep_dir(root, test, group_id, ymd, sweep_id).joinpath(rep_id)
+
+
+@lru_cache(maxsize=4096)
+def _group_manifest_path(root: str, test: bool, group_id: str, ymd: _DateKey) -> Path:
+    return _group_dir(root, test, group_id, ymd).joinpath(MANIFEST_FILENAME)
+
+
+@lru_cache(maxsize=4096)
+def _sweep_manifest_path(
+    root: str, test: bool, group_id: str, ymd: _DateKey, sweep_id: str
+) -> Path:
+    return _sweep_dir(root, test, group_id, ymd, sweep_id).joinpath(MANIFEST_FILENAME)
+
+
+@lru_cache(maxsize=4096)
+def _rep_manifest_path(
+    root: str, test: bool, group_id: str, ymd: _DateKey, sweep_id: str, rep_id: str
+) -> Path:
+    return _rep_dir(root, test, group_id, ymd, sweep_id, rep_id).joinpath(
+        MANIFEST_FILENAME
+    )
+
+
 # Group-level paths
 def get_group_dir(
     group_id: str, group_date: Union[date, datetime], test: bool = False
 ) -> Path:
     """Return path to group directory: results/YYYY/MM/DD/GGG/"""
-    return get_results_dir(test=test).joinpath(
-        str(group_date.year),
-        f"{group_date.month:02d}",
-        f"{group_date.day:02d}",
-        group_id,
-    )
+    return _group_dir(_root_key(), test, group_id, _date_key(group_date))
 
 
 def get_group_manifest_path(
     group_id: str, group_date: Union[date, datetime], test: bool = False
 ) -> Path:
-    return get_group_dir(group_id, group_date, test=test).joinpath(MANIFEST_FILENAME)
+    return _group_manifest_path(_root_key(), test, group_id, _date_key(group_date))
 
 
 # Sweep-level paths
@@ -62,7 +121,7 @@ def get_sweep_dir(
     sweep_id: str,
     test: bool = False,
 ) -> Path:
-    return get_group_dir(group_id, group_date, test=test).joinpath(sweep_id)
+    return _sweep_dir(_root_key(), test, group_id, _date_key(group_date), sweep_id)
 
 
 def get_sweep_manifest_path(
@@ -71,8 +130,8 @@ def get_sweep_manifest_path(
     sweep_id: str,
     test: bool = False,
 ) -> Path:
-    return get_sweep_dir(group_id, group_date, sweep_id, test=test).joinpath(
-        MANIFEST_FILENAME
+    return _sweep_manifest_path(
+        _root_key(), test, group_id, _date_key(group_date), sweep_id
     )
 
 
@@ -84,7 +143,9 @@ def get_rep_dir(
     rep_id: str,
     test: bool = False,
 ) -> Path:
-    return get_sweep_dir(group_id, group_date, sweep_id, test=test).joinpath(rep_id)
+    return _rep_dir(
+        _root_key(), test, group_id, _date_key(group_date), sweep_id, rep_id
+    )
 
 
 def get_rep_manifest_path(
@@ -94,6 +155,6 @@ def get_rep_manifest_path(
     rep_id: str,
     test: bool = False,
 ) -> Path:
-    return get_rep_dir(group_id, group_date, sweep_id, rep_id, test=test).joinpath(
-        MANIFEST_FILENAME
+    return _rep_manifest_path(
+        _root_key(), test, group_id, _date_key(group_date), sweep_id, rep_id
     )
@@ -0,0 +1,55 @@
+import json
+from typing import Any, Union, cast
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON.
+
+    Uses orjson when available, falling back to the standard library for
+    objects orjson rejects (e.g. integers wider than 64 bits).
+
+    Args:
+        obj (Any): JSON-serializable object.
+        indent (bool): Pretty-print with two-space indentation.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, option=option)
+        except TypeError:
+            pass
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Deserialize JSON from bytes or str.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def loads_lines(data: bytes) -> list[Any]:
+    """
+    Deserialize newline-delimited JSON (JSON Lines), skipping blank lines.
+
+    Encoders escape newlines inside strings, so the lines are first decoded in a
+    single call as one JSON array; inputs that don't form a valid array (e.g.
+    blank lines or a corrupt record) fall back to line-by-line decoding.
+    """
+    body = data.strip()
+    if not body:
+        return []
+    try:
+        return cast(list[Any], loads(b"[" + body.replace(b"\n", b",") + b"]"))
+    except ValueError:
+        return [loads(line) for line in data.splitlines() if line.strip()]
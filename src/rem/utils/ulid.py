@@ -1,17 +1,70 @@
-from datetime import datetime, timezone
+import os
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import cast
 
 import ulid
 
+_CROCKFORD32 = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+# Bit offsets of the 26 base32 digits of a 128-bit ULID, most significant first
+_SHIFTS = tuple(range(125, -1, -5))
+_CANONICAL_ULID_RE = re.compile(r"[0-7][0-9A-HJKMNP-TV-Z]{25}")
+# Lengths of the base32, hex and UUID string forms ulid.api.parse understands
+_PARSEABLE_LENGTHS = frozenset({26, 32, 36})
+# Maps Crockford digits onto the digits int(..., 32) expects
+_TO_BASE32_DIGITS = str.maketrans(_CROCKFORD32, "0123456789ABCDEFGHIJKLMNOPQRSTUV")
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# Monotonic mode of the ULID spec: within one millisecond the random part is
+# incremented rather than redrawn, so IDs from one process sort in creation
+# order and only the first ID of each millisecond reads from os.urandom
+_RANDOM_MAX = (1 << 80) - 1
+_last_ms = -1
+_last_random = 0
+_ulid_lock = threading.Lock()
+
+
+def _reset_after_fork() -> None:
+    global _last_ms, _ulid_lock
+    # Otherwise parent and child would hand out the same increments
+    _last_ms = -1
+    _ulid_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):  # not available on Windows
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
 
 def new_ulid() -> str:
     """
     Generate a new ULID string.
 
+    Encodes a 48-bit millisecond timestamp and 80 random bits directly, without
+    going through the ulid library's ULID object. IDs created in the same
+    millisecond (or after the clock stepped back) reuse the previous timestamp
+    and increment its random bits, so they always sort after the previous ID.
+
     Returns:
         str: A lexicographically sortable ULID.
     """
-    return str(ulid.new())
+    global _last_ms, _last_random
+    with _ulid_lock:
+        ms = time.time_ns() // 1_000_000
+        if ms <= _last_ms and _last_random < _RANDOM_MAX:
+            _last_random += 1
+        else:
+            # Random bits exhausted for this timestamp: wait for the clock to
+            # move past it rather than hand out an ID that sorts earlier
+            while ms <= _last_ms:
+                time.sleep(0.001)
+                ms = time.time_ns() // 1_000_000
+            _last_ms = ms
+            _last_random = int.from_bytes(os.urandom(10), "big")
+        n = (_last_ms << 80) | _last_random
+    return "".join([_CROCKFORD32[(n >> shift) & 31] for shift in _SHIFTS])
 
 
 def ulid_from_timestamp(dt: datetime) -> str:
@@ -27,6 +80,7 @@ def ulid_from_timestamp(dt: datetime) -> str:
     return str(ulid.from_timestamp(dt))
 
 
+@lru_cache(maxsize=256)
 def timestamp_from_ulid(u: str) -> datetime:
     """
     Extract the datetime from a ULID string.
@@ -37,9 +91,14 @@ def timestamp_from_ulid(u: str) -> datetime:
     Returns:
         datetime: The datetime encoded in the ULID.
     """
-    return cast(
-        datetime, ulid.api.parse(u).timestamp().datetime.replace(tzinfo=timezone.utc)
-    )
+    if _CANONICAL_ULID_RE.fullmatch(u) is not None:
+        # The first 10 digits are the millisecond timestamp; decode them in C
+        # rather than building a ulid.ULID
+        ms = int(u[:10].translate(_TO_BASE32_DIGITS), 32)
+    else:
+        # Timestamp.datetime goes through the deprecated utcfromtimestamp
+        ms = cast(int, ulid.api.parse(u).timestamp().int)
+    return _EPOCH + timedelta(milliseconds=ms)
 
 
 def is_valid_ulid(u: str) -> bool:
@@ -52,6 +111,13 @@ def is_valid_ulid(u: str) -> bool:
     Returns:
         bool: True if valid ULID, False otherwise.
     """
+    # Canonical form: 26 upper-case Crockford digits, first digit within 48 bits
+    if _CANONICAL_ULID_RE.fullmatch(u) is not None:
+        return True
+    # ulid.api.parse also accepts lower-case, hex and UUID spellings; only pay
+    # for the parse (and its exception) when the length could be one of those
+    if len(u) not in _PARSEABLE_LENGTHS:
+        return False
     try:
         ulid.api.parse(u)
         return True
@@ -4,6 +4,8 @@ import types
 import pytest
 from typer.testing import CliRunner
 
+pytestmark = pytest.mark.usefixtures("reset_logger")
+
 
 @pytest.fixture  # type: ignore[misc]
 def runner() -> CliRunner:
@@ -63,3 +65,20 @@ def test_run_cli_entrypoint(runner: CliRunner, monkeypatch: pytest.MonkeyPatch)
 
     res = runner.invoke(mod.app, ["--help"])
     assert res.exit_code == 0
+
+
+@pytest.mark.parametrize("flag", ["--version", "-V"])  # type: ignore[misc]
+def test_run_cli_version_short_circuits(
+    flag: str, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    rem = importlib.import_module("rem")
+    monkeypatch.setattr(rem, "__version__", "9.9.9-test", raising=False)
+    mod = importlib.import_module("rem.cli.main")
+
+    def _fail() -> None:
+        raise AssertionError("Typer app should not be invoked for --version")
+
+    monkeypatch.setattr(mod, "app", _fail)
+    monkeypatch.setattr(mod.sys, "argv", ["rem", flag])
+    mod.run_cli()
+    assert capsys.readouterr().out.strip() == "9.9.9-test"
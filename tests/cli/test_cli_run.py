@@ -1,12 +1,16 @@
 import importlib
 import re
+import sys
+from collections import Counter
 from pathlib import Path
-from typing import Any, Generator
+from typing import Any, Callable, Generator
 
 import pytest
 import typer
 from typer.testing import CliRunner
 
+from rem.constants import CONFIG_CACHE_SUFFIX, MANIFEST_FILENAME
+from rem.core.config import dump_yaml
 from rem.core.registry import RegistryManager
 from rem.core.stamp import format_rep_id, format_sweep_id, parse_group_id
 from rem.utils.paths import (
@@ -14,61 +18,79 @@ from rem.utils.paths import (
     get_group_dir,
     get_group_manifest_path,
     get_rep_dir,
-    get_rep_manifest_path,
     get_results_dir,
     get_sweep_dir,
-    get_sweep_manifest_path,
 )
+from rem.utils.serialization import loads
 from rem.utils.ulid import timestamp_from_ulid
 
+pytestmark = pytest.mark.usefixtures("reset_logger")
+
 runner = CliRunner()
 
+_GROUP_ID_RE = re.compile(r"Experiment group ID:\s+(G_\w{10}_\w{16})")
+
+_DUMMY_MODULE_SRC = """\
+from ml_collections import ConfigDict
+from rem.core.experiment import ExperimentBase
+
+class DummyExperiment(ExperimentBase):
+    def __init__(self, config: ConfigDict) -> None:
+        super().__init__(config)
+    def run(self) -> dict[str, str]:
+        p = self.config.get('params', {})
+        return {
+            'status': 'ok',
+            'lr': float(p.get('lr', 0)),
+            'epochs': int(p.get('epochs', 0)),
+            'use_gpu': bool(p.get('use_gpu', False)),
+        }
+"""
+
 
 def _write_yaml(path: Path, data: dict[str, Any]) -> None:
-    import yaml
-
-    with path.open("w") as f:
-        yaml.safe_dump(data, f)
-
-
-def _make_dummy_experiment_module(
-    tmp_path: Path, module_name: str = "dummy_cli_exp"
-) -> str:
-    module_file = tmp_path.joinpath(f"{module_name}.py")
-    module_src = (
-        "from ml_collections import ConfigDict\n"
-        "from rem.core.experiment import ExperimentBase\n\n"
-        "class DummyExperiment(ExperimentBase):\n"
-        "    def __init__(self, config: ConfigDict) -> None:\n"
-        "        super().__init__(config)\n"
-        "    def run(self) -> dict[str, str]:\n"
-        "        p = self.config.get('params', {})\n"
-        "        return {\n"
-        "            'status': 'ok',\n"
-        "            'lr': float(p.get('lr', 0)),\n"
-        "            'epochs': int(p.get('epochs', 0)),\n"
-        "            'use_gpu': bool(p.get('use_gpu', False)),\n"
-        "        }\n"
-    )
-    module_file.write_text(module_src)
+    path.write_text(dump_yaml(data))
+
 
-    import sys
+@pytest.fixture(scope="session")  # type: ignore[misc]
+def dummy_experiment_module(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Generator[str, None, None]:
+    """
+    Write the dummy experiment module once and make it importable for the session.
+    """
+    module_name = "dummy_cli_exp"
+    module_dir = tmp_path_factory.mktemp("dummy_exp")
+    module_file = module_dir.joinpath(f"{module_name}.py")
+    module_file.write_text(_DUMMY_MODULE_SRC)
 
-    if str(tmp_path) not in sys.path:
-        sys.path.insert(0, str(tmp_path))
+    sys.path.insert(0, str(module_dir))
     importlib.invalidate_caches()
-    return module_name
+    yield module_name
+    sys.path.remove(str(module_dir))
 
 
-@pytest.fixture(autouse=True)  # type: ignore[misc]
-def _isolate_rem_root(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-) -> Generator[None, None, None]:
-    monkeypatch.setenv("REM_ROOT", str(tmp_path))
-    yield
+@pytest.fixture(scope="module")  # type: ignore[misc]
+def config_file(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Callable[[dict[str, Any]], Path]:
+    """
+    Return a writer that saves each experiment's config once per module, so the
+    test_flag parametrizations of a test read the same file.
+    """
+    cfg_dir = tmp_path_factory.mktemp("cli_configs")
+
+    def write(cfg: dict[str, Any]) -> Path:
+        path = cfg_dir.joinpath(f"{cfg['experiment_name']}.yaml")
+        if not path.exists():
+            _write_yaml(path, cfg)
+        return path
+
+    return write
 
 
-def _load_root_app() -> typer.Typer:
+@pytest.fixture(scope="module")  # type: ignore[misc]
+def app() -> typer.Typer:
     mod = importlib.import_module("rem.cli.main")
     return getattr(mod, "app")
 
@@ -77,24 +99,26 @@ def _extract_group_id(output: str) -> str:
     """
     Lazy helper to parse "Experiment group ID: <id>" from CLI output.
     """
-    match = re.search(r"Experiment group ID:\s+(G_\w{10}_\w{16})", output)
+    match = _GROUP_ID_RE.search(output)
     assert match, f"Failed to parse group ID from output: {output}"
     return match.group(1)
 
 
 @pytest.mark.parametrize("test_flag", [False, True])  # type: ignore[misc]
-def test_cli_run_dryrun_stages(tmp_path: Path, test_flag: bool) -> None:
-    app = _load_root_app()
-
+def test_cli_run_dryrun_stages(
+    app: typer.Typer,
+    dummy_experiment_module: str,
+    config_file: Callable[[dict[str, Any]], Path],
+    test_flag: bool,
+) -> None:
     cfg = {
         "experiment_name": "demo_cli_exp",
-        "experiment_path": _make_dummy_experiment_module(tmp_path),
+        "experiment_path": dummy_experiment_module,
         "experiment_class": "DummyExperiment",
         "params": {"lr": 0.01, "epochs": 5},
         "sweep": {"lr": [0.1, 0.01, 0.001]},
     }
-    cfg_path = tmp_path.joinpath("config.yaml")
-    _write_yaml(cfg_path, cfg)
+    cfg_path = config_file(cfg)
 
     args = ["run", str(cfg_path), "--reps", "2", "--dryrun"]
     if test_flag:
@@ -114,13 +138,19 @@ def test_cli_run_dryrun_stages(tmp_path: Path, test_flag: bool) -> None:
     sweep_ids = [format_sweep_id(i) for i in range(1, 4)]
     rep_ids = [format_rep_id(i) for i in range(1, 3)]
 
-    for sweep_id in sweep_ids:
-        sweep_dir = get_sweep_dir(group_id, group_dt, sweep_id, test=test_flag)
-        assert sweep_dir.exists() and sweep_dir.is_dir()
-
-        for rep_id in rep_ids:
-            rep_dir = get_rep_dir(group_id, group_dt, sweep_id, rep_id, test=test_flag)
-            assert rep_dir.exists() and rep_dir.is_dir()
+    sweep_dirs = {
+        sweep_id: get_sweep_dir(group_id, group_dt, sweep_id, test=test_flag)
+        for sweep_id in sweep_ids
+    }
+    rep_dirs = {
+        (sweep_id, rep_id): get_rep_dir(
+            group_id, group_dt, sweep_id, rep_id, test=test_flag
+        )
+        for sweep_id in sweep_ids
+        for rep_id in rep_ids
+    }
+    for path in [*sweep_dirs.values(), *rep_dirs.values()]:
+        assert path.is_dir()
 
     # Check registry
     # Should only contain CREATE_GROUP and SUBMIT_SWEEP
@@ -129,9 +159,9 @@ def test_cli_run_dryrun_stages(tmp_path: Path, test_flag: bool) -> None:
     events = [
         e for e in rm.load_events(force_reload=True) if e.get("group_id") == group_id
     ]
-    types = [e["type"] for e in events]
-    assert types.count("CREATE_GROUP") == 1
-    assert types.count("SUBMIT_SWEEP") == 3
+    types = Counter(e["type"] for e in events)
+    assert types["CREATE_GROUP"] == 1
+    assert types["SUBMIT_SWEEP"] == 3
     assert "UPDATE_STATUS" not in types
 
     # Check that manifests are PENDING
@@ -140,34 +170,30 @@ def test_cli_run_dryrun_stages(tmp_path: Path, test_flag: bool) -> None:
     gm = GroupManifest.load(get_group_manifest_path(group_id, group_dt, test=test_flag))
     assert gm.status == "PENDING"
 
-    for sweep_id in sweep_ids:
-        sm = SweepManifest.load(
-            get_sweep_manifest_path(group_id, group_dt, sweep_id, test=test_flag)
-        )
+    # Manifests sit directly in the directories resolved above
+    for sweep_dir in sweep_dirs.values():
+        sm = SweepManifest.load(sweep_dir.joinpath(MANIFEST_FILENAME))
         assert sm.status == "PENDING"
-        for rep_id in rep_ids:
-            rmf = RepManifest.load(
-                get_rep_manifest_path(
-                    group_id, group_dt, sweep_id, rep_id, test=test_flag
-                )
-            )
-            assert rmf.status == "PENDING"
+    for rep_dir in rep_dirs.values():
+        rmf = RepManifest.load(rep_dir.joinpath(MANIFEST_FILENAME))
+        assert rmf.status == "PENDING"
 
 
 @pytest.mark.parametrize("test_flag", [False, True])  # type: ignore[misc]
-def test_cli_run_full(tmp_path: Path, test_flag: bool) -> None:
-    app = _load_root_app()
-    module_name = _make_dummy_experiment_module(tmp_path)
-
+def test_cli_run_full(
+    app: typer.Typer,
+    dummy_experiment_module: str,
+    config_file: Callable[[dict[str, Any]], Path],
+    test_flag: bool,
+) -> None:
     cfg = {
         "experiment_name": "demo_cli_full",
-        "experiment_path": module_name,
+        "experiment_path": dummy_experiment_module,
         "experiment_class": "DummyExperiment",
         "params": {"lr": 0.01, "epochs": 5},
         "sweep": {"lr": [0.1, 0.01, 0.001]},
     }
-    cfg_path = tmp_path.joinpath("config.yaml")
-    _write_yaml(cfg_path, cfg)
+    cfg_path = config_file(cfg)
 
     args = ["run", str(cfg_path), "--reps", "2"]
     if test_flag:
@@ -185,15 +211,23 @@ def test_cli_run_full(tmp_path: Path, test_flag: bool) -> None:
     events = [
         e for e in rm.load_events(force_reload=True) if e.get("group_id") == group_id
     ]
-    types = [e["type"] for e in events]
+    types = Counter(e["type"] for e in events)
 
-    assert types.count("CREATE_GROUP") == 1
-    assert types.count("SUBMIT_SWEEP") == 3
+    assert types["CREATE_GROUP"] == 1
+    assert types["SUBMIT_SWEEP"] == 3
 
-    updates = [e for e in events if e["type"] == "UPDATE_STATUS"]
     # There should be one group RUNNING, three sweep completions, and one final group status
-    assert any(e.get("status") == "RUNNING" and "sweep_id" not in e for e in updates)
-    assert sum(1 for e in updates if "sweep_id" in e) == 3
+    group_running = False
+    sweep_updates = 0
+    for e in events:
+        if e["type"] != "UPDATE_STATUS":
+            continue
+        if "sweep_id" in e:
+            sweep_updates += 1
+        elif e.get("status") == "RUNNING":
+            group_running = True
+    assert group_running
+    assert sweep_updates == 3
 
     from rem.core.manifest import GroupManifest
 
@@ -202,19 +236,20 @@ def test_cli_run_full(tmp_path: Path, test_flag: bool) -> None:
 
 
 @pytest.mark.parametrize("test_flag", [False, True])  # type: ignore[misc]
-def test_cli_run_resume(tmp_path: Path, test_flag: bool) -> None:
-    app = _load_root_app()
-    module_name = _make_dummy_experiment_module(tmp_path)
-
+def test_cli_run_resume(
+    app: typer.Typer,
+    dummy_experiment_module: str,
+    config_file: Callable[[dict[str, Any]], Path],
+    test_flag: bool,
+) -> None:
     cfg = {
         "experiment_name": "demo_cli_resume",
-        "experiment_path": module_name,
+        "experiment_path": dummy_experiment_module,
         "experiment_class": "DummyExperiment",
         "params": {"lr": 0.01, "epochs": 5},
         "sweep": {"lr": [0.1, 0.01, 0.001]},
     }
-    cfg_path = tmp_path.joinpath("config.yaml")
-    _write_yaml(cfg_path, cfg)
+    cfg_path = config_file(cfg)
 
     # First do a dryrun to stage the group
     args1 = ["run", str(cfg_path), "--reps", "2", "--dryrun"]
@@ -238,49 +273,100 @@ def test_cli_run_resume(tmp_path: Path, test_flag: bool) -> None:
     events = [
         e for e in rm.load_events(force_reload=True) if e.get("group_id") == group_id
     ]
+    types = Counter(e["type"] for e in events)
+
+    assert types["CREATE_GROUP"] == 1
+    assert types["SUBMIT_SWEEP"] == 3
+    # At least one group RUNNING and three sweep completions
+    assert types["UPDATE_STATUS"] >= 4
+
+
+def test_cli_run_cache_config_is_opt_in(
+    app: typer.Typer, dummy_experiment_module: str, tmp_path: Path
+) -> None:
+    cfg_path = tmp_path.joinpath("cached.yaml")
+    cache_path = tmp_path.joinpath("cached.yaml" + CONFIG_CACHE_SUFFIX)
+    _write_yaml(
+        cfg_path,
+        {
+            "experiment_name": "demo_cli_cache",
+            "experiment_path": dummy_experiment_module,
+            "experiment_class": "DummyExperiment",
+            "params": {"lr": 0.01, "epochs": 5},
+        },
+    )
 
-    def count(events: list[dict[str, Any]], kind: str) -> int:
-        return sum(1 for e in events if e["type"] == kind)
+    res = runner.invoke(app, ["run", str(cfg_path), "--dryrun", "--test"])
+    assert res.exit_code == 0
+    assert not cache_path.exists()
 
-    assert count(events, "CREATE_GROUP") == 1
-    assert count(events, "SUBMIT_SWEEP") == 3
-    assert (
-        count(events, "UPDATE_STATUS") >= 4
-    )  # At least one group RUNNING and three sweep completions
+    res = runner.invoke(
+        app, ["run", str(cfg_path), "--dryrun", "--test", "--cache-config"]
+    )
+    assert res.exit_code == 0
+    assert loads(cache_path.read_bytes())["config"]["params"]["epochs"] == 5
 
 
 @pytest.mark.parametrize("test_flag", [False, True])  # type: ignore[misc]
-def test_cli_local_no_staging(tmp_path: Path, test_flag: bool) -> None:
+def test_cli_local_no_staging(
+    app: typer.Typer,
+    dummy_experiment_module: str,
+    config_file: Callable[[dict[str, Any]], Path],
+    test_flag: bool,
+) -> None:
     """
     local runs should not stage group/sweep/rep dirs but should still apply overrides.
     """
-    app = _load_root_app()
-    module_name = _make_dummy_experiment_module(tmp_path)
-
     cfg = {
         "experiment_name": "demo_cli_local",
-        "experiment_path": module_name,
+        "experiment_path": dummy_experiment_module,
         "experiment_class": "DummyExperiment",
         "params": {"lr": 0.01, "epochs": 10},
     }
-    cfg_path = tmp_path.joinpath("config.yaml")
-    _write_yaml(cfg_path, cfg)
+    cfg_path = config_file(cfg)
 
     assert not get_results_dir(test=test_flag).exists()
     assert not get_default_events_path(test=test_flag).exists()
 
     res1 = runner.invoke(app, ["local", str(cfg_path)])
     assert res1.exit_code == 0
-    assert (
-        '"epochs": 10' in res1.stdout or "'epochs': 10" in res1.stdout
-    )  # Check original
+    assert loads(res1.stdout)["epochs"] == 10  # Check original
 
     res2 = runner.invoke(app, ["local", str(cfg_path), "--override", "params.epochs=5"])
     assert res2.exit_code == 0
-    assert (
-        '"epochs": 5' in res2.stdout or "'epochs': 5" in res2.stdout
-    )  # Check that override worked
+    assert loads(res2.stdout)["epochs"] == 5  # Check that override worked
 
     # Check that no staging dirs were created
     assert not get_results_dir(test=test_flag).exists()
     assert not get_default_events_path(test=test_flag).exists()
+
+
+@pytest.mark.parametrize(  # type: ignore[misc]
+    "raw,expected",
+    [
+        ("5", 5),
+        ("-3", -3),
+        ("0.01", 0.01),
+        ("1e-3", 1e-3),
+        ("-.5", -0.5),
+        ("True", True),
+        ("false", False),
+        ("adam", "adam"),
+        ("1.2.3", "1.2.3"),
+        ("1_000", 1000),
+        (" 5", 5),
+        ("2.5\n", 2.5),
+        ("1_000.000_1", 1000.0001),
+        ("1e1_0", 1e10),
+        ("1__000", "1__000"),
+        ("_1", "_1"),
+        (" true", True),
+        ("False\n", False),
+    ],
+)
+def test_coerce_override_values(raw: str, expected: Any) -> None:
+    from rem.cli.local import _coerce
+
+    value = _coerce(raw)
+    assert value == expected
+    assert type(value) is type(expected)
@@ -8,20 +8,24 @@ import pytest
 import rem.utils.logger as logger_mod
 
 
-@pytest.fixture(autouse=True)  # type: ignore[misc]
-def reset_logger_singleton() -> None:
-    """Reset global logger before each test."""
+@pytest.fixture  # type: ignore[misc]
+def reset_logger() -> None:
+    """Reset the global logger; requested by tests that (re)configure it."""
     logger_mod._LOGGER = None
     logging.getLogger("rem").handlers.clear()
 
 
+@pytest.fixture(scope="session", autouse=True)  # type: ignore[misc]
+def _data_dir_on_path() -> None:
+    """Make the experiment modules under tests/data importable, once per session."""
+    data_dir = Path(__file__).parent.joinpath("data")
+    if str(data_dir) not in sys.path:
+        sys.path.insert(0, str(data_dir))
+
+
 @pytest.fixture(autouse=True)  # type: ignore[misc]
-def _isolate_rem_root_and_path(
+def _isolate_rem_root(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> Generator[None, None, None]:
     monkeypatch.setenv("REM_ROOT", str(tmp_path))
-
-    data_dir = Path(__file__).parent.joinpath("data")
-    if str(data_dir) not in sys.path:
-        sys.path.insert(0, str(data_dir))
     yield
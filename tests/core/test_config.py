@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 import pytest
@@ -7,6 +8,7 @@ from rem.core.config import (
     diff_configs,
     flatten_config,
     load_config_from_yaml,
+    load_dict_from_yaml,
     override_config,
     to_dict,
     unflatten_config,
@@ -16,17 +18,27 @@ from rem.core.config import (
 TEST_DATA = Path(__file__).parent.parent.joinpath("data")
 
 
-def test_load_config_from_file() -> None:
-    cfg = load_config_from_yaml(TEST_DATA.joinpath("base.yaml"))
+# Parsed once per session; none of the functions under test mutate their input
+@pytest.fixture(scope="session")  # type: ignore[misc]
+def base_cfg() -> ConfigDict:
+    return load_config_from_yaml(TEST_DATA.joinpath("base.yaml"))
+
+
+@pytest.fixture(scope="session")  # type: ignore[misc]
+def override_cfg() -> ConfigDict:
+    return load_config_from_yaml(TEST_DATA.joinpath("override.yaml"))
+
+
+def test_load_config_from_file(base_cfg: ConfigDict) -> None:
+    cfg = base_cfg
     assert isinstance(cfg, ConfigDict)
     assert cfg.training.lr == 0.01  # type: ignore[attr-defined]
     assert cfg.training.epochs == 10  # type: ignore[attr-defined]
     assert cfg.model.type == "mlp"  # type: ignore[attr-defined]
 
 
-def test_override_from_file() -> None:
-    base = load_config_from_yaml(TEST_DATA.joinpath("base.yaml"))
-    override = load_config_from_yaml(TEST_DATA.joinpath("override.yaml"))
+def test_override_from_file(base_cfg: ConfigDict, override_cfg: ConfigDict) -> None:
+    base, override = base_cfg, override_cfg
     overrides_flat = {
         "training.lr": override.training.lr,  # type: ignore[attr-defined]
         "model.type": override.model.type,  # type: ignore[attr-defined]
@@ -37,10 +49,8 @@ def test_override_from_file() -> None:
     assert updated.model.type == "cnn"  # type: ignore[attr-defined]
 
 
-def test_diff_configs_from_file() -> None:
-    base = load_config_from_yaml(TEST_DATA.joinpath("base.yaml"))
-    override = load_config_from_yaml(TEST_DATA.joinpath("override.yaml"))
-    diff = diff_configs(base, override)
+def test_diff_configs_from_file(base_cfg: ConfigDict, override_cfg: ConfigDict) -> None:
+    diff = diff_configs(base_cfg, override_cfg)
     assert diff["training.lr"] == {"config1": 0.01, "config2": 0.001}
     assert diff["model.type"] == {"config1": "mlp", "config2": "cnn"}
 
@@ -52,15 +62,109 @@ def test_validate_yaml_structure() -> None:
     assert validate_yaml_structure(invalid_path) is False
 
 
-def test_flatten_and_unflatten_file_based() -> None:
-    cfg = load_config_from_yaml(TEST_DATA.joinpath("base.yaml"))
-    flat = flatten_config(cfg)
+def test_flatten_and_unflatten_file_based(base_cfg: ConfigDict) -> None:
+    flat = flatten_config(base_cfg)
     nested = unflatten_config(flat)
-    assert nested == cfg.to_dict()
+    assert nested == base_cfg.to_dict()
 
 
-def test_to_dict() -> None:
-    cfg = load_config_from_yaml(TEST_DATA.joinpath("base.yaml"))
-    d = to_dict(cfg)
+def test_to_dict(base_cfg: ConfigDict) -> None:
+    d = to_dict(base_cfg)
     assert isinstance(d, dict)
     assert d["training"]["lr"] == 0.01
+
+
+def test_load_config_writes_and_reuses_cache(tmp_path: Path) -> None:
+    cfg_path = tmp_path.joinpath("config.yaml")
+    cfg_path.write_text("training:\n  lr: 0.01\n")
+    cache_path = tmp_path.joinpath("config.yaml.cache.json")
+
+    cfg = load_config_from_yaml(cfg_path, cache=True)
+    assert cache_path.exists()
+    assert load_config_from_yaml(cfg_path, cache=True).to_dict() == cfg.to_dict()
+
+    # Editing the YAML invalidates the sidecar
+    cfg_path.write_text("training:\n  lr: 0.5\n  epochs: 3\n")
+    updated = load_config_from_yaml(cfg_path, cache=True)
+    assert updated.training.lr == 0.5  # type: ignore[attr-defined]
+    assert updated.training.epochs == 3  # type: ignore[attr-defined]
+
+
+def test_cache_detects_same_size_edit_with_preserved_mtime(tmp_path: Path) -> None:
+    cfg_path = tmp_path.joinpath("config.yaml")
+    cfg_path.write_text("lr: 0.1\n")
+    st = cfg_path.stat()
+    assert load_config_from_yaml(cfg_path, cache=True).lr == 0.1  # type: ignore[attr-defined]
+
+    # As left behind by cp -p / rsync -t: same size, same mtime, new contents
+    cfg_path.write_text("lr: 0.5\n")
+    os.utime(cfg_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert load_config_from_yaml(cfg_path, cache=True).lr == 0.5  # type: ignore[attr-defined]
+
+
+@pytest.mark.skipif(os.name != "posix", reason="file modes are POSIX-only")  # type: ignore[misc]
+def test_cache_sidecar_follows_umask(tmp_path: Path) -> None:
+    cfg_path = tmp_path.joinpath("config.yaml")
+    cfg_path.write_text("a: 1\n")
+    umask = os.umask(0)
+    os.umask(umask)
+    load_config_from_yaml(cfg_path, cache=True)
+    mode = tmp_path.joinpath("config.yaml.cache.json").stat().st_mode & 0o777
+    assert mode == 0o666 & ~umask
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "config.yaml",
+        "config.yaml.cache.json",
+    ]
+
+
+def test_load_config_without_cache(tmp_path: Path) -> None:
+    cfg_path = tmp_path.joinpath("config.yaml")
+    cfg_path.write_text("a: 1\n")
+    # Caching is opt-in
+    cfg = load_config_from_yaml(cfg_path)
+    assert cfg.a == 1  # type: ignore[attr-defined]
+    assert load_dict_from_yaml(cfg_path) == {"a": 1}
+    assert not tmp_path.joinpath("config.yaml.cache.json").exists()
+
+
+def test_flatten_config_preserves_order() -> None:
+    cfg = ConfigDict({"a": {"b": {"c": 1}, "d": 2}, "e": 3, "f": {"g": 4}})
+    flat = flatten_config(cfg)
+    assert list(flat.items()) == [("a.b.c", 1), ("a.d", 2), ("e", 3), ("f.g", 4)]
+
+
+def test_diff_configs_mismatched_structure() -> None:
+    c1 = ConfigDict({"a": {"b": 1, "c": 2}, "d": 5, "e": None})
+    c2 = ConfigDict({"a": {"b": 1, "c": 3}, "d": {"x": 1}})
+    diff = diff_configs(c1, c2)
+    assert diff == {
+        "a.c": {"config1": 2, "config2": 3},
+        "d": {"config1": 5, "config2": None},
+        "d.x": {"config1": None, "config2": 1},
+    }
+
+
+def test_override_config_nested_and_dict_values() -> None:
+    base = ConfigDict({"params": {"lr": 0.1, "epochs": 5}, "seed": 0})
+    updated = override_config(
+        base, {"params.lr": 0.01, "params": {"epochs": 10}, "new.key": True}
+    )
+    assert updated.to_dict() == {
+        "params": {"lr": 0.01, "epochs": 10},
+        "seed": 0,
+        "new": {"key": True},
+    }
+    # Original is left untouched
+    assert base.params.lr == 0.1  # type: ignore[attr-defined]
+
+
+def test_load_dict_matches_config_dict(
+    base_cfg: ConfigDict, override_cfg: ConfigDict
+) -> None:
+    raw = load_dict_from_yaml(TEST_DATA.joinpath("base.yaml"))
+    assert type(raw) is dict
+    assert raw == base_cfg.to_dict()
+    assert flatten_config(raw) == flatten_config(base_cfg)
+
+    other = load_dict_from_yaml(TEST_DATA.joinpath("override.yaml"))
+    assert diff_configs(raw, other) == diff_configs(base_cfg, override_cfg)
@@ -150,3 +150,10 @@ def test_nested_grid_zip_valid() -> None:
         }
     )
     cv.validate_config(cfg)  # no error
+
+
+def test_deeply_nested_sweep_does_not_recurse() -> None:
+    node: Any = {"lr": [0.1, 0.01]}
+    for _ in range(5000):
+        node = {"grid": [node]}
+    assert cv._collect_sweep_params_keys(node) == {"lr"}
@@ -2,13 +2,14 @@ import json
 import os
 import threading
 import warnings
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import pytest
 
 from rem.core.manifest import (
     GroupManifest,
+    ManifestHandle,
     RepManifest,
     SweepManifest,
     init_group_manifest,
@@ -20,6 +21,7 @@ from rem.core.manifest import (
     update_group_manifest,
     update_rep_manifest,
     update_sweep_manifest,
+    utc_now_iso,
 )
 from rem.core.stamp import (
     create_group_stamp,
@@ -27,6 +29,7 @@ from rem.core.stamp import (
     format_sweep_id,
     is_valid_group_id,
 )
+from rem.utils.lock import FileLock
 from rem.utils.paths import (
     get_group_manifest_path,
     get_rep_manifest_path,
@@ -41,7 +44,9 @@ def temp_manifest_paths(
     monkeypatch.setenv("REM_ROOT", str(tmp_path))
 
     group_id, group_date_str = create_group_stamp()
-    group_date = datetime.strptime(group_date_str, "%Y%m%d")
+    group_date = datetime(
+        int(group_date_str[:4]), int(group_date_str[4:6]), int(group_date_str[6:8])
+    )
     assert is_valid_group_id(group_id)
 
     sweep_id = format_sweep_id(1)
@@ -107,6 +112,16 @@ def test_manifest_lifecycle(
     assert group2.status == "COMPLETED"
 
 
+def test_utc_now_iso_is_parseable_utc() -> None:
+    before = datetime.now(timezone.utc)
+    stamp = utc_now_iso()
+    parsed = datetime.fromisoformat(stamp)
+    assert stamp.endswith("+00:00")
+    assert parsed.utcoffset() == timedelta(0)
+    assert abs(parsed - before) < timedelta(seconds=5)
+    assert utc_now_iso() >= stamp
+
+
 def test_summarize_group_status() -> None:
     sweep1 = SweepManifest(
         sweep_id=format_sweep_id(1),
@@ -203,3 +218,115 @@ def test_manifest_concurrent_saves(tmp_path: Path) -> None:
     assert path.exists()
     data = json.loads(path.read_text())
     assert data["rep_id"] in (format_rep_id(1), format_rep_id(2))
+
+
+def test_manifest_handle_batches_updates(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("manifest.json")
+    RepManifest(
+        rep_id=format_rep_id(1), sweep_id=format_sweep_id(1), group_id="G_ABC"
+    ).save(path)
+
+    with ManifestHandle(path, RepManifest) as handle:
+        handle.update(status="RUNNING")
+        handle.flush()
+        assert RepManifest.load(path).status == "RUNNING"
+
+        handle.update(status="COMPLETED", artifacts={"out": "x"})
+        # Not written until exit
+        assert RepManifest.load(path).status == "RUNNING"
+
+    final = RepManifest.load(path)
+    assert final.status == "COMPLETED"
+    assert final.artifacts == {"out": "x"}
+
+
+def test_manifest_handle_rejects_invalid_status(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("manifest.json")
+    RepManifest(
+        rep_id=format_rep_id(1), sweep_id=format_sweep_id(1), group_id="G_ABC"
+    ).save(path)
+
+    with pytest.raises(ValueError, match="for rep manifest"):
+        with ManifestHandle(path, RepManifest) as handle:
+            handle.update(status="BOGUS")
+    assert RepManifest.load(path).status == "PENDING"
+
+
+def test_log_event_appends_and_folds_on_load(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("manifest.json")
+    events_path = tmp_path.joinpath("manifest.events.jsonl")
+    sweep = SweepManifest(
+        sweep_id=format_sweep_id(1), parameter_combination={}, num_reps=1, reps=[]
+    )
+    sweep.save(path)
+    before = path.read_bytes()
+
+    sweep.log_event(path, {"status": "RUNNING"})
+    assert path.read_bytes() == before  # manifest itself is untouched
+    assert len(events_path.read_text().splitlines()) == 1
+
+    loaded = SweepManifest.load(path)
+    assert loaded.status == "RUNNING"
+    assert loaded.timestamp_updated is not None
+
+    # A full save folds the log into the manifest and clears it
+    loaded.status = "COMPLETED"
+    loaded.save(path)
+    assert not events_path.exists()
+    assert SweepManifest.load(path).status == "COMPLETED"
+
+
+def test_log_event_waits_for_manifest_lock(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("manifest.json")
+    events_path = tmp_path.joinpath("manifest.events.jsonl")
+    sweep = SweepManifest(
+        sweep_id=format_sweep_id(1), parameter_combination={}, num_reps=1, reps=[]
+    )
+    sweep.save(path)
+
+    # A writer in the middle of save() holds the lock; the append must not slip
+    # in before it clears the log
+    holder = FileLock(path)
+    holder.acquire()
+    t = threading.Thread(target=sweep.log_event, args=(path, {"status": "RUNNING"}))
+    t.start()
+    t.join(0.2)
+    assert t.is_alive()
+    assert not events_path.exists()
+    holder.release()
+    t.join()
+    assert SweepManifest.load(path).status == "RUNNING"
+
+
+def test_update_manifest_logs_non_terminal_status(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("manifest.json")
+    events_path = tmp_path.joinpath("manifest.events.jsonl")
+    RepManifest(
+        rep_id=format_rep_id(1), sweep_id=format_sweep_id(1), group_id="G_ABC"
+    ).save(path)
+
+    update_rep_manifest(path, {"status": "RUNNING"})
+    assert events_path.exists()
+    assert json.loads(path.read_text())["status"] == "PENDING"
+    assert RepManifest.load(path).status == "RUNNING"
+
+    update_rep_manifest(path, {"status": "COMPLETED"})
+    assert not events_path.exists()
+    assert json.loads(path.read_text())["status"] == "COMPLETED"
+
+
+def test_log_event_skips_non_field_keys(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("manifest.json")
+    events_path = tmp_path.joinpath("manifest.events.jsonl")
+    sweep = SweepManifest(
+        sweep_id=format_sweep_id(1), parameter_combination={}, num_reps=1, reps=[]
+    )
+    sweep.save(path)
+
+    sweep.log_event(path, {"status": "RUNNING", "note": "x"})
+    assert "note" not in events_path.read_text()
+    assert SweepManifest.load(path).status == "RUNNING"
+
+    # A log that already holds a non-field key still loads
+    events_path.write_text('{"note": "x"}\n', encoding="utf-8")
+    assert SweepManifest.load(path).status == "PENDING"
@@ -1,4 +1,5 @@
 import json
+import os
 import threading
 import time
 from pathlib import Path
@@ -8,6 +9,7 @@ import pytest
 
 from rem.core.registry import VALID_EVENT_TYPES, RegistryManager
 from rem.core.status import TERMINAL_STATUSES, VALID_STATUSES
+from rem.utils.serialization import dumps
 
 
 def make_event(
@@ -114,6 +116,183 @@ class TestRegistryManager:
         with pytest.raises(ValueError, match="must include 'group_id'"):
             registry.append_event(event)
 
+    def test_reload_reads_only_new_events(self, events_path: Path) -> None:
+        reader = RegistryManager(events_path=events_path)
+        writer = RegistryManager(events_path=events_path)
+        writer.append_event(make_event("A", "PENDING"))
+        assert len(reader.load_events()) == 1
+
+        writer.append_event(make_event("A", "RUNNING"))
+        # Cached until explicitly reloaded
+        assert len(reader.load_events()) == 1
+        events = reader.load_events(force_reload=True)
+        assert [e["status"] for e in events] == ["PENDING", "RUNNING"]
+
+    def test_own_appends_keep_cache_warm(self, registry: RegistryManager) -> None:
+        registry.append_event(make_event("A", "PENDING"))
+        assert len(registry.load_events()) == 1
+        registry.append_event(make_event("A", "RUNNING"))
+        assert registry.load_events()[-1]["status"] == "RUNNING"
+
+    def test_torn_trailing_line_is_deferred(self, events_path: Path) -> None:
+        registry = RegistryManager(events_path=events_path)
+        registry.append_event(make_event("A", "PENDING"))
+        line = json.dumps(make_event("A", "RUNNING")).encode("utf-8")
+        with events_path.open("ab") as f:
+            f.write(line[:10])
+        assert len(registry.load_events(force_reload=True)) == 1
+
+        with events_path.open("ab") as f:
+            f.write(line[10:] + b"\n")
+        events = registry.load_events(force_reload=True)
+        assert [e["status"] for e in events] == ["PENDING", "RUNNING"]
+
+    def test_repeated_values_are_interned(self, events_path: Path) -> None:
+        events_path.write_bytes(
+            b"".join(
+                dumps(make_event("GROUP_1", "COMPLETED")) + b"\n" for _ in range(2)
+            )
+        )
+        first, second = RegistryManager(events_path=events_path).load_events()
+        assert first["group_id"] is second["group_id"]
+        assert first["status"] is second["status"]
+        assert first["type"] is second["type"]
+
+    def test_reload_after_truncation(self, events_path: Path) -> None:
+        registry = RegistryManager(events_path=events_path)
+        registry.append_event(make_event("A", "PENDING"))
+        registry.append_event(make_event("B", "PENDING"))
+        assert len(registry.load_events()) == 2
+
+        events_path.write_text(json.dumps(make_event("C", "RUNNING")) + "\n")
+        events = registry.load_events(force_reload=True)
+        assert [e["group_id"] for e in events] == ["C"]
+
+    def test_group_index_tracks_appends_and_reloads(self, events_path: Path) -> None:
+        registry = RegistryManager(events_path=events_path)
+        registry.append_event(make_event("A", "PENDING"))
+        registry.append_event(make_event("B", event_type="CREATE_GROUP"))
+        assert registry.get_latest_status("A") == "PENDING"
+        assert registry.get_latest_status("B") is None
+
+        # Appends from another manager show up after a reload
+        other = RegistryManager(events_path=events_path)
+        other.append_event(make_event("B", "RUNNING"))
+        other.append_event(make_event("A", "COMPLETED"))
+        registry.load_events(force_reload=True)
+        assert registry.get_latest_status("A") == "COMPLETED"
+        assert registry.get_latest_status("B") == "RUNNING"
+        assert [e["type"] for e in registry.get_group_history("B")] == [
+            "CREATE_GROUP",
+            "UPDATE_STATUS",
+        ]
+        assert registry.is_group_terminal("A")
+
+    def test_reload_detects_replaced_file_of_same_size(self, events_path: Path) -> None:
+        registry = RegistryManager(events_path=events_path)
+        registry.append_event(make_event("A1", "PENDING"))
+        assert [e["group_id"] for e in registry.load_events()] == ["A1"]
+        registry.close()
+
+        # Same byte length, different contents, new inode
+        replacement = events_path.with_name("events.new")
+        replacement.write_bytes(dumps(make_event("B1", "PENDING")) + b"\n")
+        assert replacement.stat().st_size == events_path.stat().st_size
+        os.replace(replacement, events_path)
+
+        events = registry.load_events(force_reload=True)
+        assert [e["group_id"] for e in events] == ["B1"]
+        assert registry.get_latest_status("A1") is None
+
+    def test_batched_appends_are_written_on_flush(self, events_path: Path) -> None:
+        registry = RegistryManager(events_path=events_path, batch_size=3)
+        registry.append_event(make_event("G1", "PENDING"))
+        registry.append_event(make_event("G1", "RUNNING"))
+        assert not events_path.exists() or events_path.read_bytes() == b""
+        registry.append_event(make_event("G1", "COMPLETED"))
+        assert len(events_path.read_text().splitlines()) == 3
+
+        registry.append_event(make_event("G2", "PENDING"))
+        registry.flush()
+        assert len(events_path.read_text().splitlines()) == 4
+
+    def test_partial_batch_is_flushed_after_max_delay(self, events_path: Path) -> None:
+        registry = RegistryManager(
+            events_path=events_path, batch_size=100, max_delay=0.01
+        )
+        registry.append_event(make_event("G1", "PENDING"))
+        registry.append_event(make_event("G1", "RUNNING"))
+        timer = registry._flush_timer
+        assert timer is not None
+        timer.join(timeout=5)
+        assert len(events_path.read_text().splitlines()) == 2
+        assert registry._flush_timer is None
+
+        # An explicit flush disarms the timer
+        registry.append_event(make_event("G1", "COMPLETED"))
+        registry.flush()
+        assert registry._flush_timer is None
+
+    def test_fsync_once_per_flush(
+        self, events_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        calls: list[int] = []
+
+        def fake_fsync(fd: int) -> None:
+            # Only count syncs of the events file (FileLock syncs its lock file)
+            if events_path.exists() and os.path.samestat(
+                os.fstat(fd), os.stat(events_path)
+            ):
+                calls.append(fd)
+
+        monkeypatch.setattr("rem.core.registry.os.fsync", fake_fsync)
+        registry = RegistryManager(events_path=events_path, batch_size=4, fsync=True)
+        for status in ("PENDING", "RUNNING", "COMPLETED"):
+            registry.append_event(make_event("G1", status))
+        assert calls == []
+        registry.close()
+        assert len(calls) == 1
+        assert len(events_path.read_text().splitlines()) == 3
+
+    def test_load_flushes_pending_events(self, events_path: Path) -> None:
+        registry = RegistryManager(events_path=events_path, batch_size=10)
+        registry.append_event(make_event("G1", "PENDING"))
+        assert registry.get_latest_status("G1") == "PENDING"
+        assert len(events_path.read_text().splitlines()) == 1
+
+    def test_append_handle_is_reused_and_reopened(self, events_path: Path) -> None:
+        registry = RegistryManager(events_path=events_path)
+        registry.append_event(make_event("G1", "PENDING"))
+        fd = registry._fd
+        registry.append_event(make_event("G1", "RUNNING"))
+        assert fd is not None and registry._fd == fd
+
+        registry.close()
+        assert registry._fd is None
+        registry.append_event(make_event("G1", "COMPLETED"))
+        registry.close()
+        assert len(events_path.read_text().splitlines()) == 3
+
+    def test_cold_latest_status_scans_from_tail(
+        self, events_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        writer = RegistryManager(events_path=events_path)
+        writer.append_event(make_event("A", "PENDING"))
+        writer.append_event(make_event("B", "PENDING"))
+        writer.append_event(make_event("A", "RUNNING"))
+        for _ in range(20):
+            writer.append_event(make_event("B", event_type="PATCH_GROUP"))
+        with events_path.open("ab") as f:
+            f.write(b'{"type": "UPDATE_STATUS", "group_id": "A", "sta')
+
+        # Small windows force lines to be stitched across chunk boundaries
+        monkeypatch.setattr("rem.core.registry._TAIL_CHUNK_SIZE", 7)
+        reader = RegistryManager(events_path=events_path)
+        assert reader.get_latest_status("A") == "RUNNING"
+        assert reader.get_latest_status("B") == "PENDING"
+        assert reader.get_latest_status("C") is None
+        assert reader._events is None
+
     def test_concurrent_appends_are_serialized(self, tmp_path: Path) -> None:
         events_path = tmp_path.joinpath("events.jsonl")
         rm = RegistryManager(events_path=events_path)
@@ -9,17 +9,15 @@ import pytest
 from ml_collections import ConfigDict
 
 from rem.constants import EVENTS_FILENAME, MANIFEST_FILENAME
+from rem.core.config import dump_yaml
 from rem.core.manifest import GroupManifest, RepManifest, SweepManifest
 from rem.core.registry import RegistryManager
 from rem.core.runner import MainRunner, run_local
 
 
 def write_yaml(path: Path, data: dict[str, Any]) -> None:
-    import yaml
-
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w") as f:
-        yaml.safe_dump(data, f)
+    path.write_text(dump_yaml(data))
 
 
 def make_dummy_experiment_module(
@@ -143,6 +141,36 @@ def test_dryrun_stages(rem_root: Path, cfg_path: Path, test_flag: bool) -> None:
             assert rep_manifest.status == "PENDING"
 
 
+@pytest.mark.parametrize("write_flat", [True, False])  # type: ignore[misc]
+def test_flat_config_is_opt_in(cfg_path: Path, write_flat: bool) -> None:
+    from rem.constants import CONFIG_FLAT_FILENAME, SUBCONFIG_FILENAME
+    from rem.core.stamp import format_rep_id, format_sweep_id, parse_group_id
+    from rem.utils.paths import get_rep_dir
+    from rem.utils.ulid import timestamp_from_ulid
+
+    cfg = {
+        "experiment_name": "demo",
+        "experiment_path": "dummy_experiment",
+        "experiment_class": "DummyExp",
+        "params": {"epochs": 5, "lr": 0.001},
+    }
+    write_yaml(cfg_path, cfg)
+    runner = MainRunner(test=True, dryrun=True, write_flat_config=write_flat)
+    group_id = runner.start(cfg_path)
+
+    group_dt = timestamp_from_ulid(parse_group_id(group_id))
+    rep_dir = get_rep_dir(
+        group_id, group_dt, format_sweep_id(1), format_rep_id(1), test=True
+    )
+    assert rep_dir.joinpath(SUBCONFIG_FILENAME).exists()
+    assert rep_dir.joinpath(CONFIG_FLAT_FILENAME).exists() is write_flat
+
+
+def test_event_fsync_is_opt_in() -> None:
+    assert MainRunner(test=True).registry.fsync is False
+    assert MainRunner(test=True, fsync_events=True).registry.fsync is True
+
+
 @pytest.mark.parametrize("test_flag", [True, False])  # type: ignore[misc]
 def test_full_run(cfg_path: Path, tmp_path: Path, test_flag: bool) -> None:
     """
@@ -227,6 +255,59 @@ def test_full_run(cfg_path: Path, tmp_path: Path, test_flag: bool) -> None:
             assert rep_manifest.status in {"COMPLETED", "CRASHED"}
 
 
+def test_full_run_process_pool(cfg_path: Path, tmp_path: Path) -> None:
+    """
+    With max_workers > 1, reps run in worker processes and the main process records
+    the same statuses and events as a sequential run.
+    """
+    module_name = make_dummy_experiment_module(tmp_path)
+    cfg = {
+        "experiment_name": "demo",
+        "experiment_path": module_name,
+        "experiment_class": "DummyExp",
+        "params": {"epochs": 5, "lr": 0.001},
+        "sweep": {"lr": [0.001, 0.01]},
+    }
+    write_yaml(cfg_path, cfg)
+
+    runner = MainRunner(test=True, dryrun=False, max_workers=2)
+    group_id = runner.start(cfg_path, reps_per_sweep=2)
+
+    from rem.core.stamp import format_rep_id, format_sweep_id, parse_group_id
+    from rem.utils.paths import (
+        get_default_events_path,
+        get_group_manifest_path,
+        get_rep_manifest_path,
+        get_sweep_manifest_path,
+    )
+    from rem.utils.ulid import timestamp_from_ulid
+
+    group_dt = timestamp_from_ulid(parse_group_id(group_id))
+    assert (
+        GroupManifest.load(
+            get_group_manifest_path(group_id, group_dt, test=True)
+        ).status
+        == "COMPLETED"
+    )
+    sweep_ids = [format_sweep_id(i) for i in range(1, 3)]
+    for sweep_id in sweep_ids:
+        sm_path = get_sweep_manifest_path(group_id, group_dt, sweep_id, test=True)
+        assert SweepManifest.load(sm_path).status == "COMPLETED"
+        for rep_id in [format_rep_id(i) for i in range(1, 3)]:
+            rep_manifest = RepManifest.load(
+                get_rep_manifest_path(group_id, group_dt, sweep_id, rep_id, test=True)
+            )
+            assert rep_manifest.status == "COMPLETED"
+
+    rm = RegistryManager(events_path=get_default_events_path(test=True))
+    updates = [
+        e
+        for e in rm.load_events(force_reload=True)
+        if e.get("group_id") == group_id and e["type"] == "UPDATE_STATUS"
+    ]
+    assert [e.get("sweep_id") for e in updates] == [None, *sweep_ids, None]
+
+
 @pytest.mark.parametrize("test_flag", [True, False])  # type: ignore[misc]
 def test_resume_from_dryrun_reuses_group(
     cfg_path: Path, tmp_path: Path, test_flag: bool
@@ -286,6 +367,51 @@ def test_resume_from_dryrun_reuses_group(
     assert count_types(pre_events, "UPDATE_STATUS") == 0
 
 
+def test_unserializable_artifacts_crash_rep(cfg_path: Path, tmp_path: Path) -> None:
+    """
+    Artifacts that can't be written to the manifest mark the rep CRASHED, and the
+    rest of the group still runs.
+    """
+    tmp_path.joinpath("unserializable_experiment.py").write_text(
+        "from rem.core.experiment import ExperimentBase\n\n"
+        "class BadExp(ExperimentBase):\n"
+        "    def run(self) -> dict[str, object]:\n"
+        "        return {'obj': object()}\n"
+    )
+    if str(tmp_path) not in sys.path:
+        sys.path.insert(0, str(tmp_path))
+    importlib.invalidate_caches()
+    cfg = {
+        "experiment_name": "demo",
+        "experiment_path": "unserializable_experiment",
+        "experiment_class": "BadExp",
+        "params": {"lr": 0.001},
+        "sweep": {"lr": [0.001, 0.01]},
+    }
+    write_yaml(cfg_path, cfg)
+
+    group_id = MainRunner(test=True).start(cfg_path)
+
+    from rem.core.stamp import format_rep_id, format_sweep_id, parse_group_id
+    from rem.utils.paths import get_rep_manifest_path, get_sweep_manifest_path
+    from rem.utils.ulid import timestamp_from_ulid
+
+    group_dt = timestamp_from_ulid(parse_group_id(group_id))
+    for i in (1, 2):
+        sweep_id = format_sweep_id(i)
+        rep = RepManifest.load(
+            get_rep_manifest_path(
+                group_id, group_dt, sweep_id, format_rep_id(1), test=True
+            )
+        )
+        assert rep.status == "CRASHED"
+        assert rep.artifacts == {}
+        sweep = SweepManifest.load(
+            get_sweep_manifest_path(group_id, group_dt, sweep_id, test=True)
+        )
+        assert sweep.status == "PARTIAL_COMPLETION"
+
+
 @pytest.mark.parametrize("test_flag", [True, False])  # type: ignore[misc]
 def test_run_local(
     cfg_path: Path, tmp_path: Path, test_flag: bool, monkeypatch: pytest.MonkeyPatch
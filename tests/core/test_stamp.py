@@ -65,6 +65,8 @@ def test_is_valid_group_id() -> None:
         "G_1234567890ABCDEF",
         "G_1234567890_ABC",
         "BAD_01HYZ3W6Y8_1234567890123456",
+        "G_123456789_01234567890123456",
+        "G_1234567890_123456789012345_",
     ]
     for gid in bad_ids:
         assert not is_valid_group_id(gid)
@@ -72,7 +74,7 @@ def test_is_valid_group_id() -> None:
 
 def test_is_valid_sweep_id() -> None:
     valid = format_sweep_id(42)
-    invalids = ["X_0042", "S_abc", "S_"]
+    invalids = ["X_0042", "S_abc", "S_", "S_\u00b2"]
 
     assert is_valid_sweep_id(valid)
     for sid in invalids:
@@ -81,7 +83,7 @@ def test_is_valid_sweep_id() -> None:
 
 def test_is_valid_rep_id() -> None:
     valid = format_rep_id(42)
-    invalids = ["R_", "REP_0042", "R_abc"]
+    invalids = ["R_", "REP_0042", "R_abc", "R_\u00b2"]
 
     assert is_valid_rep_id(valid)
     for rid in invalids:
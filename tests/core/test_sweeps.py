@@ -26,6 +26,17 @@ def test_zip() -> None:
     assert result == expected
 
 
+@pytest.mark.parametrize("width", [1, 2, 3, 4, 5])  # type: ignore[misc]
+def test_zip_any_width(width: int) -> None:
+    keys = [f"k{i}" for i in range(width)]
+    node = {"zip": {k: [i, i + 10] for i, k in enumerate(keys)}}
+    expected = [
+        {k: i for i, k in enumerate(keys)},
+        {k: i + 10 for i, k in enumerate(keys)},
+    ]
+    assert expand_sweep_node(node) == expected
+
+
 def test_nested_grid_zip() -> None:
     node = {
         "grid": [
@@ -67,3 +78,16 @@ def test_missing_sweep_returns_single_element() -> None:
     cfg = {"experiment_name": "baseline"}
     elements = get_sweep_elements(cfg)
     assert elements == [("S_0001", {})]
+
+
+def test_grid_duplicate_keys_raise() -> None:
+    node = {"grid": [{"lr": [0.01, 0.1]}, {"zip": {"lr": [1, 2], "b": [3, 4]}}]}
+    with pytest.raises(ValueError, match="Duplicate key 'lr'"):
+        expand_sweep_node(node)
+
+
+def test_grid_duplicate_key_reported_in_key_order() -> None:
+    # Both 'z' and 'a' collide; the first one in key order is reported
+    node = {"grid": [{"z": [1], "a": [2]}, {"zip": {"z": [3], "a": [4]}}]}
+    with pytest.raises(ValueError, match="Duplicate key 'z'"):
+        expand_sweep_node(node)
@@ -0,0 +1,14 @@
+from pathlib import Path
+
+from rem.utils.files import write_files
+
+
+def test_write_files_creates_and_truncates(tmp_path: Path) -> None:
+    a = tmp_path / "a.yaml"
+    b = tmp_path / "b.yaml"
+    a.write_bytes(b"stale contents that are longer\n")
+
+    write_files([(a, b"x: 1\n"), (b, b"")])
+
+    assert a.read_bytes() == b"x: 1\n"
+    assert b.exists() and b.read_bytes() == b""
@@ -2,12 +2,16 @@ from __future__ import annotations
 
 import json
 import os
+import socket
+import subprocess
+import sys
 import threading
 import time
 from pathlib import Path
 
 import pytest
 
+from rem.utils import lock as lock_mod
 from rem.utils.lock import FileLock, LockInfo
 
 
@@ -64,25 +68,19 @@ def test_context_manager_releases_on_exception(tmp_target: Path) -> None:
 def test_mutual_exclusion_between_threads(tmp_target: Path) -> None:
     order = []
 
-    def worker(
-        name: str, start_evt: threading.Event, done_evt: threading.Event
-    ) -> None:
-        start_evt.wait()
+    # Both threads are released together, so they contend from the same moment
+    start = threading.Barrier(2)
+
+    def worker(name: str) -> None:
+        start.wait()
         with FileLock(tmp_target):
             order.append(name)
             time.sleep(0.05)
-        done_evt.set()
 
-    s1, s2 = threading.Event(), threading.Event()
-    d1, d2 = threading.Event(), threading.Event()
-    t1 = threading.Thread(target=worker, args=("A", s1, d1))
-    t2 = threading.Thread(target=worker, args=("B", s2, d2))
+    t1 = threading.Thread(target=worker, args=("A",))
+    t2 = threading.Thread(target=worker, args=("B",))
     t1.start()
     t2.start()
-    s1.set()
-    s2.set()
-    d1.wait()
-    d2.wait()
     t1.join()
     t2.join()
 
@@ -90,6 +88,88 @@ def test_mutual_exclusion_between_threads(tmp_target: Path) -> None:
     assert order in (["A", "B"], ["B", "A"])
 
 
+def test_release_wakes_waiter_in_same_process(tmp_target: Path) -> None:
+    holder = FileLock(tmp_target)
+    holder.acquire()
+    released_at: list[float] = []
+
+    def release_later() -> None:
+        # Long enough for the waiter's backoff to reach multi-100ms sleeps
+        time.sleep(0.6)
+        released_at.append(time.monotonic())
+        holder.release()
+
+    t = threading.Thread(target=release_later)
+    t.start()
+    waiter = FileLock(tmp_target)
+    waiter.acquire(timeout=5.0, poll_interval=5.0)
+    acquired_at = time.monotonic()
+    waiter.release()
+    t.join()
+
+    assert acquired_at - released_at[0] < 0.2
+
+
+def test_threads_queue_on_in_process_lock(
+    tmp_target: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    holder = FileLock(tmp_target)
+    holder.acquire()
+    attempts: list[LockInfo] = []
+    original = FileLock._create_exclusive
+
+    def counting(self: FileLock, info: LockInfo) -> bool:
+        attempts.append(info)
+        return original(self, info)
+
+    monkeypatch.setattr(FileLock, "_create_exclusive", counting)
+
+    def waiter() -> None:
+        with FileLock(tmp_target):
+            pass
+
+    t = threading.Thread(target=waiter)
+    t.start()
+    time.sleep(0.2)
+    # The waiter is blocked in-process and hasn't tried to create the file
+    assert attempts == []
+    holder.release()
+    t.join()
+    assert len(attempts) == 1
+
+
+def test_nested_acquire_in_same_thread_is_not_reentrant(tmp_target: Path) -> None:
+    outer = FileLock(tmp_target, stale_after=None)
+    outer.acquire()
+    try:
+        t0 = time.monotonic()
+        with pytest.raises(TimeoutError):
+            FileLock(tmp_target, stale_after=None).acquire(timeout=0.1)
+        assert time.monotonic() - t0 < 1.0
+        # With stale_after, the outer lock is broken as if held by another process
+        with FileLock(tmp_target, stale_after=0.1):
+            pass
+    finally:
+        outer.release()
+    # The in-process lock was released along with the outer lock
+    free = FileLock(tmp_target)
+    free.acquire(blocking=False)
+    free.release()
+
+
+def test_abandoned_in_process_lock_goes_stale(tmp_target: Path) -> None:
+    # A lock taken by another thread and never released is broken like one
+    # left behind by a dead process
+    abandoned = FileLock(tmp_target, stale_after=0.2)
+    t = threading.Thread(target=abandoned.acquire)
+    t.start()
+    t.join()
+    t0 = time.monotonic()
+    with FileLock(tmp_target, stale_after=0.2):
+        pass
+    assert time.monotonic() - t0 < 2.0
+
+
 def test_stale_lock_breaking(tmp_target: Path) -> None:
     # Manually create a stale-looking lock
     lp = lock_path_for(tmp_target)
@@ -110,3 +190,147 @@ def test_stale_lock_breaking(tmp_target: Path) -> None:
     finally:
         lock2.release()
     assert not lp.exists()
+
+
+def test_polling_reuses_parsed_lock_info(
+    tmp_target: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Held by "another process": threads of this one would wait on the
+    # in-process lock without polling the lock file at all
+    lp = lock_path_for(tmp_target)
+    lp.parent.mkdir(parents=True, exist_ok=True)
+    info = LockInfo(
+        pid=os.getpid(),
+        hostname=socket.gethostname(),
+        timestamp=time.time(),
+        namespace=lock_mod._PID_NAMESPACE,
+    )
+    lp.write_bytes(info.to_bytes())
+    parses: list[Path] = []
+    original = LockInfo.from_json
+
+    def counting(path: Path) -> LockInfo | None:
+        parses.append(path)
+        return original(path)
+
+    monkeypatch.setattr(LockInfo, "from_json", staticmethod(counting))
+    try:
+        waiter = FileLock(tmp_target, stale_after=60.0)
+        with pytest.raises(TimeoutError):
+            waiter.acquire(timeout=0.3, poll_interval=0.02)
+    finally:
+        lp.unlink()
+    assert len(parses) == 1
+
+
+def test_lock_info_bytes_are_json(tmp_path: Path) -> None:
+    info = LockInfo(
+        pid=42, hostname='host "a"\\b', timestamp=time.time(), namespace="boot/pid:[1]"
+    )
+    assert json.loads(info.to_bytes()) == {
+        "pid": 42,
+        "hostname": 'host "a"\\b',
+        "timestamp": info.timestamp,
+        "namespace": "boot/pid:[1]",
+    }
+    path = tmp_path.joinpath("x.lock")
+    path.write_bytes(info.to_bytes())
+    assert LockInfo.from_json(path) == info
+
+
+def test_empty_stale_lock_is_broken(tmp_target: Path) -> None:
+    lp = lock_path_for(tmp_target)
+    lp.parent.mkdir(parents=True, exist_ok=True)
+    lp.touch()
+    old = time.time() - 9999
+    os.utime(lp, (old, old))
+
+    lock = FileLock(tmp_target, stale_after=0.5, durable=True)
+    lock.acquire(timeout=1.0, poll_interval=0.05)
+    lock.release()
+    assert not lp.exists()
+
+
+@pytest.mark.skipif(  # type: ignore[misc]
+    os.name != "posix" or not lock_mod._PID_NAMESPACE,
+    reason="liveness probe is POSIX-only and needs a known PID namespace",
+)
+def test_lock_from_dead_local_process_is_broken(tmp_target: Path) -> None:
+    proc = subprocess.Popen([sys.executable, "-c", "pass"])
+    proc.wait()
+    lp = lock_path_for(tmp_target)
+    lp.parent.mkdir(parents=True, exist_ok=True)
+    info = LockInfo(
+        pid=proc.pid,
+        hostname=socket.gethostname(),
+        timestamp=time.time(),
+        namespace=lock_mod._PID_NAMESPACE,
+    )
+    lp.write_bytes(info.to_bytes())
+
+    lock = FileLock(tmp_target, stale_after=60.0)
+    lock.acquire(timeout=1.0)
+    lock.release()
+
+
+@pytest.mark.skipif(os.name != "posix", reason="liveness probe is POSIX-only")  # type: ignore[misc]
+def test_dead_pid_in_other_namespace_is_not_broken(tmp_target: Path) -> None:
+    # Same hostname and a PID that doesn't exist here, but written from another
+    # container (PID namespace), where that PID may well be alive
+    proc = subprocess.Popen([sys.executable, "-c", "pass"])
+    proc.wait()
+    lp = lock_path_for(tmp_target)
+    lp.parent.mkdir(parents=True, exist_ok=True)
+    info = LockInfo(
+        pid=proc.pid,
+        hostname=socket.gethostname(),
+        timestamp=time.time(),
+        namespace="other-boot/pid:[1]",
+    )
+    lp.write_bytes(info.to_bytes())
+
+    lock = FileLock(tmp_target, stale_after=60.0)
+    with pytest.raises(TimeoutError):
+        lock.acquire(timeout=0.3)
+    assert lp.exists()
+
+
+@pytest.mark.skipif(os.name != "posix", reason="liveness probe is POSIX-only")  # type: ignore[misc]
+def test_lock_without_namespace_is_not_probed(tmp_target: Path) -> None:
+    # Lock files from older versions have no namespace key: the holder's PID
+    # can't be trusted to mean the same process here
+    proc = subprocess.Popen([sys.executable, "-c", "pass"])
+    proc.wait()
+    lp = lock_path_for(tmp_target)
+    lp.parent.mkdir(parents=True, exist_ok=True)
+    lp.write_text(
+        json.dumps(
+            {
+                "pid": proc.pid,
+                "hostname": socket.gethostname(),
+                "timestamp": time.time(),
+            }
+        )
+    )
+    info = LockInfo.from_json(lp)
+    assert info is not None and info.namespace == ""
+
+    lock = FileLock(tmp_target, stale_after=60.0)
+    with pytest.raises(TimeoutError):
+        lock.acquire(timeout=0.3)
+    assert lp.exists()
+
+
+def test_nfs_safe_lock_excludes_and_cleans_up(tmp_target: Path) -> None:
+    lock = FileLock(tmp_target, nfs_safe=True)
+    lock.acquire()
+    try:
+        assert json.loads(lock_path_for(tmp_target).read_bytes())["pid"] == os.getpid()
+        other = FileLock(tmp_target, nfs_safe=True)
+        with pytest.raises(BlockingIOError):
+            other.acquire(blocking=False)
+    finally:
+        lock.release()
+    assert sorted(p.name for p in tmp_target.parent.iterdir()) == []
+    with FileLock(tmp_target, nfs_safe=True):
+        pass
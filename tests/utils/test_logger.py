@@ -1,8 +1,22 @@
 import logging
+import multiprocessing
+import os
+import queue
 import tempfile
+from logging.handlers import QueueHandler
 from pathlib import Path
 
-from rem.utils.logger import get_logger
+import pytest
+
+from rem.utils.logger import (
+    _DrainFlushFileHandler,
+    current_log_file,
+    get_logger,
+    log_to_file,
+    stop_file_logging,
+)
+
+pytestmark = pytest.mark.usefixtures("reset_logger")
 
 
 def test_logger_and_log_file() -> None:
@@ -13,16 +27,69 @@ def test_logger_and_log_file() -> None:
         logger.info("Hello test!")
         logger.debug("Debug message")
 
-        # Flush and remove the FileHandler to release the file
-        for handler in logger.handlers:
-            if isinstance(handler, logging.FileHandler):
-                handler.flush()
-                handler.close()
-        logger.handlers = [
-            h for h in logger.handlers if not isinstance(h, logging.FileHandler)
-        ]
+        # Drain the queue and close the file handler to release the file
+        stop_file_logging()
+        assert not any(isinstance(h, QueueHandler) for h in logger.handlers)
 
         with open(log_file, encoding="utf-8") as f:
             contents = f.read()
             assert "Hello test!" in contents
             assert "Debug message" in contents
+
+
+def test_file_handler_flushes_once_queue_drains(tmp_path: Path) -> None:
+    log_file = tmp_path / "drain.log"
+    records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    handler = _DrainFlushFileHandler(log_file, records)
+    try:
+        make = logging.makeLogRecord
+        # More records are waiting, so this one stays in the stream buffer
+        records.put(make({"msg": "queued"}))
+        handler.handle(make({"msg": "first"}))
+        assert log_file.read_text() == ""
+
+        records.get()
+        handler.handle(make({"msg": "second"}))
+        assert log_file.read_text().splitlines() == ["first", "second"]
+    finally:
+        handler.close()
+
+
+def _log_from_child() -> None:
+    get_logger().info("from child")
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs fork")  # type: ignore[misc]
+def test_forked_child_writes_to_log_file(tmp_path: Path) -> None:
+    log_file = tmp_path / "fork.log"
+    logger = get_logger(log_file=log_file)
+    logger.info("from parent")
+
+    proc = multiprocessing.get_context("fork").Process(target=_log_from_child)
+    proc.start()
+    proc.join()
+    assert proc.exitcode == 0
+    stop_file_logging()
+
+    lines = log_file.read_text().splitlines()
+    assert sum("from child" in line for line in lines) == 1
+    assert sum("from parent" in line for line in lines) == 1
+
+
+def test_log_to_file_attaches_once(tmp_path: Path) -> None:
+    log_file = tmp_path / "worker.log"
+    logger = get_logger()
+    assert current_log_file() is None
+
+    log_to_file(log_file)
+    log_to_file(log_file)
+    file_handlers = [h for h in logger.handlers if isinstance(h, logging.FileHandler)]
+    try:
+        assert len(file_handlers) == 1
+        assert current_log_file() == log_file
+        logger.info("from worker")
+        assert "from worker" in log_file.read_text()
+    finally:
+        for handler in file_handlers:
+            logger.removeHandler(handler)
+            handler.close()
@@ -5,6 +5,7 @@ from pathlib import Path
 import pytest
 from _pytest.monkeypatch import MonkeyPatch
 
+from rem.constants import MANIFEST_FILENAME
 from rem.utils import paths
 from rem.utils.ulid import new_ulid
 
@@ -44,3 +45,22 @@ def test_path_construction(tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
     assert paths.get_rep_manifest_path(
         group_id, d, sweep_id, rep_id
     ) == rep_path.joinpath("manifest.json")
+
+
+def test_cached_paths_follow_rem_root(tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+    d = date(2025, 7, 1)
+    monkeypatch.setenv("REM_ROOT", str(tmp_path / "a"))
+    first = paths.get_rep_dir("G_x", d, "S_0001", "R_001")
+    assert paths.get_rep_dir("G_x", d, "S_0001", "R_001") is first
+
+    monkeypatch.setenv("REM_ROOT", str(tmp_path / "b"))
+    second = paths.get_rep_dir("G_x", d, "S_0001", "R_001")
+    assert second == tmp_path.joinpath("b", "results", "2025", "07", "01").joinpath(
+        "G_x", "S_0001", "R_001"
+    )
+    assert paths.get_group_dir("G_x", d, test=True).parent == tmp_path.joinpath(
+        "b", "results", "test", "2025", "07", "01"
+    )
+    assert paths.get_rep_manifest_path("G_x", d, "S_0001", "R_001") == (
+        second.joinpath(MANIFEST_FILENAME)
+    )
@@ -0,0 +1,47 @@
+import json
+
+import pytest
+
+from rem.utils import serialization
+
+
+@pytest.mark.parametrize("indent", [False, True])  # type: ignore[misc]
+def test_dumps_loads_roundtrip(indent: bool) -> None:
+    obj = {"a": 1, "b": [1.5, None, True], "c": {"d": "e"}}
+    data = serialization.dumps(obj, indent=indent)
+    assert isinstance(data, bytes)
+    assert serialization.loads(data) == obj
+    assert json.loads(data) == obj
+
+
+def test_dumps_indent_is_multiline() -> None:
+    assert b"\n" in serialization.dumps({"a": 1}, indent=True)
+    assert b"\n" not in serialization.dumps({"a": 1})
+
+
+def test_dumps_falls_back_for_big_ints() -> None:
+    big = 2**70
+    assert serialization.loads(serialization.dumps({"n": big})) == {"n": big}
+
+
+def test_stdlib_fallback(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(serialization, "orjson", None)
+    data = serialization.dumps({"a": [1, 2]}, indent=True)
+    assert serialization.loads(data) == {"a": [1, 2]}
+
+
+def test_loads_lines_skips_blank_lines() -> None:
+    data = b'{"a": 1}\n\n{"b": 2}\r\n  \n'
+    assert serialization.loads_lines(data) == [{"a": 1}, {"b": 2}]
+    assert serialization.loads_lines(b"") == []
+
+
+def test_loads_lines_matches_per_line_decoding() -> None:
+    records = [{"a": "x\ny"}, [1, 2], "s", 3]
+    data = b"".join(serialization.dumps(r) + b"\n" for r in records)
+    assert serialization.loads_lines(data) == records
+
+
+def test_loads_lines_raises_on_corrupt_line() -> None:
+    with pytest.raises(ValueError):
+        serialization.loads_lines(b'{"a": 1}\n{"b": \n')
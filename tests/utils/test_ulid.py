@@ -3,6 +3,7 @@ import warnings
 from datetime import datetime, timedelta, timezone
 
 import pytest
+import ulid
 
 from rem.utils import ulid as ulid_utils
 
@@ -18,6 +19,49 @@ def test_new_ulid_format_and_uniqueness() -> None:
     assert u1 != u2
 
 
+def test_new_ulid_is_monotonic_within_millisecond(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(ulid_utils.time, "time_ns", lambda: 1_700_000_000_000_000_000)
+    ulids = [ulid_utils.new_ulid() for _ in range(5)]
+
+    assert len({u[:10] for u in ulids}) == 1
+    assert ulids == sorted(ulids)
+    assert len(set(ulids)) == 5
+
+
+def test_new_ulid_stays_ordered_when_clock_steps_back(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(ulid_utils, "_last_ms", -1)
+    clock = iter([1_700_000_000_005_000_000, 1_700_000_000_000_000_000])
+    monkeypatch.setattr(ulid_utils.time, "time_ns", lambda: next(clock))
+    u1, u2 = ulid_utils.new_ulid(), ulid_utils.new_ulid()
+
+    assert u1 < u2
+    assert u1[:10] == u2[:10]  # keeps the later timestamp
+
+
+def test_new_ulid_waits_for_next_millisecond_on_overflow(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(ulid_utils, "_last_ms", -1)
+    clock = iter([1_700_000_000_000_000_000] * 3 + [1_700_000_000_001_000_000])
+    monkeypatch.setattr(ulid_utils.time, "time_ns", lambda: next(clock))
+    sleeps: list[float] = []
+    monkeypatch.setattr(ulid_utils.time, "sleep", sleeps.append)
+
+    u1 = ulid_utils.new_ulid()
+    monkeypatch.setattr(ulid_utils, "_last_random", ulid_utils._RANDOM_MAX)
+    u2 = ulid_utils.new_ulid()
+
+    assert u1 < u2
+    assert len(sleeps) == 2
+    assert ulid_utils.timestamp_from_ulid(u2) - ulid_utils.timestamp_from_ulid(
+        u1
+    ) == timedelta(milliseconds=1)
+
+
 def test_ulid_from_timestamp_and_sort_order() -> None:
     dt1 = datetime(2023, 1, 1, 12, 0, 0)
     dt2 = dt1 + timedelta(seconds=1)
@@ -37,14 +81,31 @@ def test_timestamp_roundtrip() -> None:
     now = datetime.now(timezone.utc)
     u = ulid_utils.ulid_from_timestamp(now)
 
-    with warnings.catch_warnings():
-        warnings.simplefilter("ignore", DeprecationWarning)
-        extracted = ulid_utils.timestamp_from_ulid(u)
+    extracted = ulid_utils.timestamp_from_ulid(u)
 
     delta = abs(extracted - now)
     assert delta < timedelta(milliseconds=1)
 
 
+@pytest.mark.parametrize(  # type: ignore
+    "ulid_str",
+    [
+        "01HZY6KTQ8A3NZQ0D8BC1TYZVE",
+        "00000000000000000000000000",
+        "01ARZ3NDEKTSV4RRFFQ69G5FAV",
+        "01hzy6ktq8a3nzq0d8bc1tyzve",  # non-canonical: decoded by the library
+    ],
+)
+def test_timestamp_matches_ulid_library(ulid_str: str) -> None:
+    # The library's own datetime conversion is what emits the DeprecationWarning
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        expected = ulid.api.parse(ulid_str).timestamp().datetime
+    assert ulid_utils.timestamp_from_ulid(ulid_str) == expected.replace(
+        tzinfo=timezone.utc
+    )
+
+
 @pytest.mark.parametrize(  # type: ignore
     "ulid_str,is_valid",
     [
@@ -53,7 +114,19 @@ def test_timestamp_roundtrip() -> None:
         ("", False),
         ("01HZY6KTQ8A3NZQ0D8BC1TYZV", False),  # 25 chars
         ("01HZY6KTQ8A3NZQ0D8BC1TYZVE000", False),  # too long
+        ("81HZY6KTQ8A3NZQ0D8BC1TYZVE", False),  # timestamp overflows 48 bits
+        ("01hzy6ktq8a3nzq0d8bc1tyzve", True),  # lower-case is accepted by parse
     ],
 )
 def test_is_valid_ulid(ulid_str: str, is_valid: bool) -> None:
     assert ulid_utils.is_valid_ulid(ulid_str) == is_valid
+
+
+def test_new_ulid_encodes_current_time() -> None:
+    before = datetime.now(timezone.utc)
+    u = ulid_utils.new_ulid()
+    assert ulid_utils.is_valid_ulid(u)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        extracted = ulid_utils.timestamp_from_ulid(u)
+    assert abs(extracted - before) < timedelta(seconds=1)